@@ -41,6 +41,12 @@ from typing import List, Dict, Optional
 import json
 from datetime import datetime
 
+# ``active_profile.txt`` path -> ``((st_mtime_ns, st_size), name)`` of its last
+# read or write.  Shared by every ProfileManager in the process, so a switch made
+# through one instance is seen by the others even when the new name has the same
+# length and lands in the same timestamp tick (coarse FAT/exFAT mtimes).
+_ACTIVE_PROFILE_CACHE: dict = {}
+
 
 class ProfileManager:
     """Read/write access to named configuration profiles.
@@ -629,18 +635,40 @@ class ProfileManager:
         return True
 
     def get_active_profile(self) -> str:
-        """Return the currently active profile name, defaulting to ``"Default Settings"``."""
-        if self.active_profile_path.exists():
-            try:
-                return self.active_profile_path.read_text().strip()
-            except Exception:
-                pass
-        return "Default Settings"
+        """Return the currently active profile name, defaulting to ``"Default Settings"``.
+
+        The file is only re-read when its modification time or size differs from
+        the last read or write in this process (``_ACTIVE_PROFILE_CACHE``), so
+        repeated calls cost a single ``stat``.
+        """
+        try:
+            st = self.active_profile_path.stat()
+        except OSError:
+            return "Default Settings"
+        key = (st.st_mtime_ns, st.st_size)
+        cached = _ACTIVE_PROFILE_CACHE.get(self.active_profile_path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        try:
+            name = self.active_profile_path.read_text().strip()
+        except Exception:
+            return "Default Settings"
+        _ACTIVE_PROFILE_CACHE[self.active_profile_path] = (key, name)
+        return name
 
     def set_active_profile(self, name: str):
         """Persist *name* as the currently active profile (written to ``active_profile.txt``)."""
         with open(self.active_profile_path, 'w') as f:
             f.write(name)
+        try:
+            st = self.active_profile_path.stat()
+        except OSError:
+            _ACTIVE_PROFILE_CACHE.pop(self.active_profile_path, None)
+        else:
+            _ACTIVE_PROFILE_CACHE[self.active_profile_path] = (
+                (st.st_mtime_ns, st.st_size),
+                name.strip(),
+            )
 
     def _load_json(self, file_path: Path) -> Dict:
         """Read and JSON-decode *file_path*, returning a dict."""
@@ -63,6 +63,10 @@ class DatabaseManager:
 
     def __init__(self, db_path: Path | str = "data/lccn_harvester.sqlite3"):
         self.db_path = Path(db_path)
+        # Set after the first successful connect(): the parent directory exists
+        # and WAL mode (persistent in the file header) is already enabled, so
+        # later connections on a shared instance skip that setup.
+        self._prepared = False
 
     @staticmethod
     def _default_schema_path() -> Path:
@@ -127,14 +131,17 @@ class DatabaseManager:
         Raises:
             Any exception raised inside the block (after rolling back).
         """
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        if not self._prepared:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         conn = sqlite3.connect(self.db_path, timeout=30.0)
         conn.row_factory = sqlite3.Row
 
         # Safety + performance pragmas
         conn.execute("PRAGMA foreign_keys = ON;")
-        conn.execute("PRAGMA journal_mode = WAL;")     # better concurrent reads/writes
+        if not self._prepared:
+            conn.execute("PRAGMA journal_mode = WAL;")  # better concurrent reads/writes
+            self._prepared = True
         conn.execute("PRAGMA synchronous = FULL;")     # fsync WAL on every commit – prevents corruption on crash
         conn.execute("PRAGMA temp_store = MEMORY;")    # faster temp operations
         conn.execute("PRAGMA busy_timeout = 5000;")    # wait up to 5 s if db is locked
@@ -171,6 +178,9 @@ class DatabaseManager:
                     logger.warning("Deleted corrupt DB file: %s", path)
             except Exception as exc:
                 logger.error("Could not delete %s: %s", path, exc)
+        # The recreated file no longer carries WAL mode in its header, so the
+        # next connect() must set it up again.
+        self._prepared = False
 
     def init_db(self, schema_path: Optional[Path] = None) -> None:
         """Initialise the database from ``schema.sql`` and run any pending migrations.
@@ -884,6 +894,56 @@ class DatabaseManager:
             for row in rows
         ]
 
+    def get_all_attempted_for_many(self, isbns: Iterable[str]) -> dict[str, list[AttemptedRecord]]:
+        """Batch form of ``get_all_attempted_for`` for many ISBNs at once.
+
+        Loads the ISBNs into a connection-local TEMP table and joins it against
+        ``attempted`` in a single statement, so a large input file costs one
+        prepared query instead of one round-trip (or one ``IN`` chunk) per ISBN.
+
+        Returns:
+            Dict mapping each ISBN that has attempted rows to its records, most
+            recent first.  ISBNs with no attempted rows are absent.
+        """
+        isbns_list = list(dict.fromkeys(isbns))
+        found: dict[str, list[AttemptedRecord]] = {}
+        if not isbns_list:
+            return found
+
+        with self.connect() as conn:
+            # One explicit read transaction so the shared lock on the main
+            # database is taken once for the whole lookup.
+            conn.execute("BEGIN")
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS _want_isbns (isbn TEXT PRIMARY KEY) WITHOUT ROWID")
+            conn.executemany(
+                "INSERT OR IGNORE INTO _want_isbns (isbn) VALUES (?)",
+                ((isbn,) for isbn in isbns_list),
+            )
+            # CROSS JOIN pins the temp table as the outer loop so each ISBN is
+            # an idx_attempted_isbn probe; a plain JOIN lets the planner scan all
+            # of attempted via idx_attempted_last_attempted to skip the sort.
+            # Iterate the cursor directly; no intermediate fetchall() list.
+            rows = conn.execute(
+                """
+                SELECT a.isbn, a.last_target, a.attempt_type, a.last_attempted, a.fail_count, a.last_error
+                FROM _want_isbns w
+                CROSS JOIN attempted a ON a.isbn = w.isbn
+                ORDER BY a.last_attempted DESC
+                """
+            )
+            for row in rows:
+                found.setdefault(row["isbn"], []).append(
+                    AttemptedRecord(
+                        isbn=row["isbn"],
+                        last_target=row["last_target"],
+                        attempt_type=row["attempt_type"] or "both",
+                        last_attempted=row["last_attempted"],
+                        fail_count=int(row["fail_count"]),
+                        last_error=row["last_error"],
+                    )
+                )
+        return found
+
     def get_attempted_for(self, isbn: str, last_target: str, attempt_type: str) -> Optional[AttemptedRecord]:
         """Return attempted row for a specific ISBN+target+type key."""
         with self.connect() as conn:
@@ -914,10 +974,22 @@ class DatabaseManager:
         This helper accepts both formats so retry behavior stays stable.
         """
         att = self.get_attempted_for(isbn, last_target, attempt_type)
-        if att is None or not att.last_attempted:
+        if att is None:
+            return False
+        return self.is_within_retry_window(att.last_attempted, retry_days)
+
+    @staticmethod
+    def is_within_retry_window(last_attempted, retry_days: int) -> bool:
+        """Return True when *last_attempted* is less than *retry_days* days ago.
+
+        Pure date check behind ``should_skip_retry``; use it directly when the
+        attempted rows were already fetched (e.g. via ``get_all_attempted_for_many``)
+        to avoid one extra query per row.
+        """
+        if not last_attempted:
             return False
 
-        last_val = att.last_attempted
+        last_val = last_attempted
         try:
             # Parse the stored date accepting multiple historical formats:
             # "YYYY-MM-DD HH:MM:SS"  -- ISO datetime string (legacy storage)
@@ -11,7 +11,7 @@ from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QTextBrowser, QPushBut
 from PyQt6.QtCore import Qt
 
 from .theme_manager import ThemeManager
-from .styles import generate_stylesheet, CATPPUCCIN_DARK, CATPPUCCIN_LIGHT
+from .styles import stylesheet_for_theme
 
 
 def load_accessibility_statement() -> str:
@@ -65,8 +65,7 @@ class AccessibilityStatementDialog(QDialog):
         """Apply the full application stylesheet matching the current theme."""
         theme_mgr = ThemeManager()
         mode = theme_mgr.get_theme()
-        palette = CATPPUCCIN_DARK if mode == "dark" else CATPPUCCIN_LIGHT
-        self.setStyleSheet(generate_stylesheet(palette))
+        self.setStyleSheet(stylesheet_for_theme(mode))
 
     def _setup_ui(self):
         """Build the dialog layout: title label, subtitle, scrollable QTextBrowser, close button.
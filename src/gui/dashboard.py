@@ -21,6 +21,7 @@ Design notes:
   (``"idle"``, ``"running"``, ``"paused"``, ``"success"``, ``"error"``) so
   QSS can colour it without any inline style overrides.
 """
+import csv
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -87,6 +88,25 @@ class DashboardTab(QWidget):
     pause_harvest_requested = pyqtSignal()
     cancel_harvest_requested = pyqtSignal()
 
+    # Auto-refresh polling intervals.  KPI cards and recent results are pushed
+    # by signals; the timer only tracks result files on disk, which change
+    # quickly during a run but rarely while idle.
+    _REFRESH_INTERVAL_RUNNING_MS = 2000
+    _REFRESH_INTERVAL_IDLE_MS = 10000
+    _REFRESH_COALESCE_MS = 100
+    _LIVE_STATUS_THROTTLE_MS = 50
+    _RECENT_RESULTS_THROTTLE_MS = 250
+
+    # Inline styles for the Pause/Resume button, built once rather than per toggle.
+    _PAUSE_BUTTON_STYLE = (
+        "background-color: #f97316; color: #ffffff; border: 1px solid #ea580c; "
+        "border-radius: 10px; font-weight: 700; padding: 8px 16px;"
+    )
+    _RESUME_BUTTON_STYLE = (
+        "background-color: #2563eb; color: #ffffff; border: 1px solid #1d4ed8; "
+        "border-radius: 10px; font-weight: 700; padding: 8px 16px;"
+    )
+
     def __init__(self):
         super().__init__()
         # Shared database manager; init_db() is idempotent so it is safe to call at construction.
@@ -102,6 +122,8 @@ class DashboardTab(QWidget):
             "profile_dir": None,
         }
         self.current_profile = "default"
+        # Cleared by the main window while a MARC import writes to the profile.
+        self._profile_controls_enabled = True
         self._baseline_stats = {
             "processed": 0,
             "found": 0,
@@ -120,14 +142,40 @@ class DashboardTab(QWidget):
         self.last_run_text = "Last Run: Never"
         # Tracks the current responsive layout mode ("compact" or "wide"); avoids redundant re-layouts.
         self._responsive_mode = None
+        # Set when refresh_data is called while the page is hidden; the refresh
+        # then runs once in showEvent instead of repainting an off-screen page.
+        self._pending_refresh = False
+        # Database browser dialog, created on first open and reused afterwards.
+        self._db_browser = None
         self._setup_ui()
 
-        # Polls every 2 s to keep result-file button states and the last-run label current.
+        # Polls to keep result-file button states and the last-run label current:
+        # every 2 s during a harvest, every 10 s while idle (see set_running/set_idle).
         # Note: KPI counts are updated via signals, not here.
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.refresh_data)
-        self.timer.start(2000)
-        
+        self.timer.start(self._REFRESH_INTERVAL_IDLE_MS)
+
+        # Collapses bursts of request_refresh() calls (e.g. a harvest finishing
+        # while targets and profile controls update) into a single refresh.
+        self._refresh_coalesce_timer = QTimer(self)
+        self._refresh_coalesce_timer.setSingleShot(True)
+        self._refresh_coalesce_timer.setInterval(self._REFRESH_COALESCE_MS)
+        self._refresh_coalesce_timer.timeout.connect(self.refresh_data)
+
+        # Throttles the per-ISBN "Last Event" label to one repaint per window.
+        self._live_status_timer = QTimer(self)
+        self._live_status_timer.setSingleShot(True)
+        self._live_status_timer.setInterval(self._LIVE_STATUS_THROTTLE_MS)
+        self._live_status_timer.timeout.connect(self._flush_live_status)
+
+        # Throttles the recent-results table, which harvest events would
+        # otherwise rebuild once per processed ISBN.
+        self._recent_results_timer = QTimer(self)
+        self._recent_results_timer.setSingleShot(True)
+        self._recent_results_timer.setInterval(self._RECENT_RESULTS_THROTTLE_MS)
+        self._recent_results_timer.timeout.connect(self._flush_recent_results)
+
         self.refresh_data()
 
     def _setup_ui(self):
@@ -267,6 +315,28 @@ class DashboardTab(QWidget):
         # ── Page 1: Linked ISBNs full panel ───────────────────────
         self._main_stack.addWidget(self._build_linked_isbn_page())
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.timer.start()
+        self.flush_pending_refresh()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        # Nothing on this page is visible, so stop polling until it is shown.
+        self.timer.stop()
+
+    def request_refresh(self):
+        """Schedule a refresh, merging requests made within a short window."""
+        # Not restarted while pending, so a steady stream of requests still
+        # refreshes every interval instead of waiting for the stream to stop.
+        if not self._refresh_coalesce_timer.isActive():
+            self._refresh_coalesce_timer.start()
+
+    def flush_pending_refresh(self):
+        """Run a refresh that was deferred while the dashboard was off screen."""
+        if self._pending_refresh:
+            self.refresh_data()
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
         self._apply_responsive_layout(event.size().width())
@@ -518,9 +588,6 @@ class DashboardTab(QWidget):
 
     def _export_linked_isbns(self):
         """Export the ``linked_isbns`` DB table to a timestamped TSV file and open it."""
-        import csv as _csv
-        from datetime import datetime as _dt
-
         # Query the database
         try:
             with self.db.connect() as conn:
@@ -545,12 +612,12 @@ class DashboardTab(QWidget):
         # Write export file into the profile folder
         out_dir = self._profile_dir_path()
         out_dir.mkdir(parents=True, exist_ok=True)
-        stamp = _dt.now().strftime("%Y-%m-%d-%H-%M-%S")
+        stamp = datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
         out_path = out_dir / f"{safe_filename(self.current_profile)}-linked-isbns-{stamp}.tsv"
 
         try:
             with open(out_path, "w", newline="", encoding="utf-8-sig") as fh:
-                writer = _csv.writer(fh, delimiter="\t")
+                writer = csv.writer(fh, delimiter="\t")
                 writer.writerow(["ISBN", "Canonical ISBN"])
                 writer.writerows(rows)
         except Exception as exc:
@@ -597,9 +664,16 @@ class DashboardTab(QWidget):
         self.set_idle(None)
 
     def _open_database_browser(self):
-        """Open the DatabaseBrowserDialog as a modal window."""
-        dialog = DatabaseBrowserDialog(parent=self, db=self.db)
-        dialog.exec()
+        """Open the DatabaseBrowserDialog as a modal window.
+
+        The dialog is built on first use and kept afterwards; later opens only
+        reload its data instead of reconstructing the tab widgets.
+        """
+        if self._db_browser is None:
+            self._db_browser = DatabaseBrowserDialog(parent=self, db=self.db)
+        else:
+            self._db_browser.reload()
+        self._db_browser.exec()
 
     def _go_to_linked_isbn_page(self):
         """Switch the main stack to the Linked ISBNs sub-page (index 1)."""
@@ -894,7 +968,17 @@ class DashboardTab(QWidget):
         Called on the 2-second auto-refresh timer and after harvest events.
         Updates result-file button states, KPI labels, recent-results table,
         and the last-run label.  Does *not* re-query the database.
+
+        While the dashboard is not on screen (another page is shown or the
+        window is minimized) the refresh is deferred to the next
+        ``showEvent`` / ``flush_pending_refresh``, so harvest events do no
+        widget work for a page the user cannot see.
         """
+        if not self.isVisible() or self.window().isMinimized():
+            self._pending_refresh = True
+            return
+        self._pending_refresh = False
+        self._refresh_coalesce_timer.stop()
         try:
             self._refresh_result_file_buttons()
             self._render_session_stats()
@@ -914,9 +998,18 @@ class DashboardTab(QWidget):
             isbn: The ISBN being processed (currently unused in this display path).
             progress: Progress fraction or count (currently unused in this display path).
             msg: Human-readable status message to display.
+
+        The label is repainted at most once per ``_LIVE_STATUS_THROTTLE_MS``;
+        the newest message wins.
         """
         self.last_run_text = truncate_text(f"Last Event: {msg}", 140)
-        self.lbl_last_run.setText(self.last_run_text)
+        if not self._live_status_timer.isActive():
+            self._live_status_timer.start()
+
+    def _flush_live_status(self):
+        """Show the newest buffered live-status message."""
+        if self.lbl_last_run.text() != self.last_run_text:
+            self.lbl_last_run.setText(self.last_run_text)
 
     def record_harvest_event(self, isbn: str, status: str, detail: str):
         """Record a harvest event into the recent-results list.
@@ -1020,7 +1113,7 @@ class DashboardTab(QWidget):
         self._render_session_stats()
 
     def _append_recent_result(self, isbn: str, status: str, detail: str):
-        """Prepend a single result row to the session recent-results list and refresh the panel.
+        """Prepend a single result row to the session recent-results list and schedule a panel refresh.
 
         The list is capped at 10 entries (most recent first).  Status strings are
         normalised to one of three display labels: ``"Successful"``, ``"Linked ISBN"``,
@@ -1049,6 +1142,11 @@ class DashboardTab(QWidget):
         )
         # Cap at 10 entries (most recent first) to avoid unbounded memory growth.
         self.session_recent = self.session_recent[:10]
+        if not self._recent_results_timer.isActive():
+            self._recent_results_timer.start()
+
+    def _flush_recent_results(self):
+        """Push the buffered recent-results list to the table."""
         self.recent_panel.update_data(self.session_recent)
 
     def _render_session_stats(self):
@@ -1085,9 +1183,17 @@ class DashboardTab(QWidget):
         self.result_files["profile_dir"] = self._profile_dir_path()
         self._refresh_result_file_buttons()
 
+    def set_profile_controls_enabled(self, enabled):
+        """Allow or block profile switching from the dashboard.
+
+        The main window turns this off while a MARC import is writing to the
+        active profile.
+        """
+        self._profile_controls_enabled = bool(enabled)
+
     def _on_profile_combo_changed(self, name):
         """Relay profile-combo selection to the main window via the ``profile_selected`` signal."""
-        if name:
+        if name and self._profile_controls_enabled:
             self.profile_selected.emit(name)
         
 
@@ -1154,6 +1260,7 @@ class DashboardTab(QWidget):
     def set_running(self):
         """Switch the dashboard status pill to RUNNING and enable live controls."""
         self._is_running = True
+        self.timer.setInterval(self._REFRESH_INTERVAL_RUNNING_MS)
         self.session_stats = {
             "processed": 0,
             "successful": 0,
@@ -1165,10 +1272,7 @@ class DashboardTab(QWidget):
         self._refresh_result_file_buttons()
         self.btn_pause_harvest.setText("Pause")
         self.btn_pause_harvest.setEnabled(True)
-        self.btn_pause_harvest.setStyleSheet(
-            "background-color: #f97316; color: #ffffff; border: 1px solid #ea580c; "
-            "border-radius: 10px; font-weight: 700; padding: 8px 16px;"
-        )
+        self._set_pause_button_style(self._PAUSE_BUTTON_STYLE)
         self.btn_cancel_harvest.setEnabled(True)
         self.lbl_run_status.setText("● RUNNING")
         self.lbl_run_status.setProperty("state", "running")
@@ -1178,12 +1282,8 @@ class DashboardTab(QWidget):
         """Update the dashboard status pill and controls for pause/resume."""
         self.btn_pause_harvest.setText("Resume" if is_paused else "Pause")
         self.btn_pause_harvest.setEnabled(True)
-        self.btn_pause_harvest.setStyleSheet(
-            "background-color: #2563eb; color: #ffffff; border: 1px solid #1d4ed8; "
-            "border-radius: 10px; font-weight: 700; padding: 8px 16px;"
-            if is_paused else
-            "background-color: #f97316; color: #ffffff; border: 1px solid #ea580c; "
-            "border-radius: 10px; font-weight: 700; padding: 8px 16px;"
+        self._set_pause_button_style(
+            self._RESUME_BUTTON_STYLE if is_paused else self._PAUSE_BUTTON_STYLE
         )
         self.btn_cancel_harvest.setEnabled(True)
         if is_paused:
@@ -1194,13 +1294,23 @@ class DashboardTab(QWidget):
             self.lbl_run_status.setProperty("state", "running")
         self._refresh_status_style()
 
+    def _set_pause_button_style(self, style: str):
+        """Apply *style* to the Pause/Resume button unless it already has it.
+
+        ``setStyleSheet`` re-parses the QSS and repolishes the widget, so it is
+        skipped when the state (and therefore the style) did not change.
+        """
+        if self.btn_pause_harvest.styleSheet() != style:
+            self.btn_pause_harvest.setStyleSheet(style)
+
     def set_idle(self, success: bool | None = None):
         """Transition the dashboard status pill to a terminal or idle state."""
         self._is_running = False
+        self.timer.setInterval(self._REFRESH_INTERVAL_IDLE_MS)
         self._refresh_result_file_buttons()
         self.btn_pause_harvest.setText("Pause")
         self.btn_pause_harvest.setEnabled(False)
-        self.btn_pause_harvest.setStyleSheet("")
+        self._set_pause_button_style("")
         self.btn_cancel_harvest.setEnabled(False)
         if success is True:
             self.lbl_run_status.setText("● COMPLETED")
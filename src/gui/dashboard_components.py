@@ -255,10 +255,20 @@ class RecentResultsPanel(QFrame):
         if self._context_menu_open or records_key == self._last_records_key:
             return
         self._last_records_key = records_key
-        self.table.setRowCount(0)
-        for row_idx, record in enumerate(records):
-            self.table.insertRow(row_idx)
+        # Size the table once and hold repaints until every cell is filled,
+        # instead of repainting after each inserted row.
+        self.table.setUpdatesEnabled(False)
+        try:
+            self._populate_rows(records or [])
+        finally:
+            self.table.setUpdatesEnabled(True)
+        self._fit_table_height()
 
+    def _populate_rows(self, records):
+        """Fill the table with one row per record."""
+        self.table.clearContents()
+        self.table.setRowCount(len(records))
+        for row_idx, record in enumerate(records):
             self.table.setItem(row_idx, 0, QTableWidgetItem(record["isbn"]))
 
             status = record["status"]
@@ -275,7 +285,6 @@ class RecentResultsPanel(QFrame):
             item_detail = QTableWidgetItem(truncate_text(detail_text, 90))
             item_detail.setToolTip(detail_text)
             self.table.setItem(row_idx, 2, item_detail)
-        self._fit_table_height()
 
     def _show_context_menu(self, pos):
         """Show a stable copy menu for the cell under the pointer."""
@@ -326,13 +335,17 @@ class ProfileSwitchCombo(QComboBox):
     affordance is always visible regardless of the active stylesheet.
     """
 
+    # Light contrasting chevron pen, built once instead of on every repaint
+    # (paintEvent runs on hover, focus and resize).
+    _CHEVRON_PEN = QPen(QColor("#e6eaf6"), 2)
+
     def paintEvent(self, event):
         """Draw the base combo box then overlay a custom chevron arrow."""
         super().paintEvent(event)
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        # Draw the chevron in a light contrasting colour near the right edge.
-        painter.setPen(QPen(QColor("#e6eaf6"), 2))
+        # Draw the chevron near the right edge.
+        painter.setPen(self._CHEVRON_PEN)
         cx = self.width() - 21   # horizontal centre of the chevron, inset from the right
         cy = self.height() // 2 + 1
         size = 5                  # half-width of the downward-pointing chevron
@@ -438,3 +438,21 @@ class DatabaseBrowserDialog(QDialog):
             # Only load if the tab is empty and has no pending search query.
             if tab and not tab._all_rows and not tab.search_box.text():
                 tab.load_data()
+
+    def reload(self):
+        """Re-fetch the visible tab and mark the others for a lazy reload.
+
+        Lets a caller keep one dialog instance and re-``exec()`` it instead of
+        rebuilding every tab's widgets on each open, while still showing rows
+        written since it was last shown.
+        """
+        current = self.tab_widget.currentWidget()
+        for tab in self._tabs.values():
+            if tab is current:
+                tab.load_data()
+            else:
+                tab._all_rows = []
+                # Clear the search too, so _load_tab re-fetches on next visit.
+                tab.search_box.blockSignals(True)
+                tab.search_box.clear()
+                tab.search_box.blockSignals(False)
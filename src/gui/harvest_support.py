@@ -22,6 +22,9 @@ Threading model:
 - File writes inside the worker use ``_live_results_lock`` (a ``threading.Lock``)
   to protect the shared file handles from concurrent access when ``parallel_workers``
   is greater than 1.
+- The linked-ISBNs snapshot is rewritten on a private single-thread
+  ``QThreadPool`` (``_linked_pool``); ``run()`` drains it and writes a final
+  snapshot before returning.
 - ``_stop_requested`` and ``_pause_requested`` are plain Python booleans set from
   the GUI thread.  Python's GIL makes single-value boolean reads/writes atomic, so
   no additional lock is needed for these flags.
@@ -33,10 +36,11 @@ import csv
 import logging
 import re
 import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from PyQt6.QtCore import QThread, QTimer, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThread, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtGui import QDragEnterEvent, QDropEvent
 from PyQt6.QtWidgets import QGroupBox, QMessageBox
 
@@ -45,12 +49,49 @@ from src.database import DatabaseManager, now_datetime_str
 from src.database.db_manager import yyyymmdd_to_iso_date
 from src.harvester.marc_import import ParsedMarcImportRecord
 from src.harvester.orchestrator import HarvestCancelled
-from src.harvester.run_harvest import RunStats, parse_isbn_file, run_harvest
+from src.harvester.run_harvest import RunStats, parse_isbn_file_cached, run_harvest
 from src.harvester.targets import create_target_from_config
 from src.utils import messages
 
 logger = logging.getLogger(__name__)
 
+# Write buffer for whole-file TSV/CSV exports (snapshots, MARC import output).
+# Per-row live appends flush after every row, so they keep the default buffer.
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+
+class _BackgroundJobSignals(QObject):
+    """Signals for ``_BackgroundJob``, delivered to slots on the UI thread."""
+
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(object)
+
+
+class _BackgroundJob(QRunnable):
+    """Run one call on ``QThreadPool`` and report its outcome through signals.
+
+    ``finished`` carries the return value and ``failed`` the raised exception.
+    Connect both before passing the job to ``QThreadPool.start``, and keep a
+    reference to the job until one of them fires.
+    """
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        # Owned by Python so the signal carrier outlives run() until delivery.
+        self.setAutoDelete(False)
+        self.signals = _BackgroundJobSignals()
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+
+    def run(self):
+        try:
+            result = self._fn(*self._args, **self._kwargs)
+        except Exception as exc:
+            self.signals.failed.emit(exc)
+            return
+        self.signals.finished.emit(result)
+
 
 def _write_csv_rows(rows_with_header: list, path: str) -> None:
     """Write *rows_with_header* to a UTF-8 BOM CSV for Excel and Google Sheets.
@@ -61,7 +102,7 @@ def _write_csv_rows(rows_with_header: list, path: str) -> None:
         rows_with_header: List of rows (first element should be the header row).
         path: Absolute path string for the output CSV file.
     """
-    with open(path, "w", newline="", encoding="utf-8-sig") as handle:
+    with open(path, "w", newline="", encoding="utf-8-sig", buffering=_EXPORT_BUFFER_SIZE) as handle:
         writer = csv.writer(handle)
         writer.writerows(rows_with_header)
 
@@ -293,6 +334,9 @@ class HarvestWorker(QThread):
         self.input_file = input_file
         self.config = config
         self.db_path = db_path
+        # One manager for the worker's own DB work (linked snapshots, invalid-ISBN
+        # rows) so repeated snapshot refreshes reuse its one-time connection setup.
+        self._db = DatabaseManager(db_path)
         self.targets = targets
         self.advanced_settings = advanced_settings or {}
         # ISBNs that should bypass the retry-window check for this specific run.
@@ -306,6 +350,14 @@ class HarvestWorker(QThread):
         # (the same connectivity issue appearing across many ISBNs) are not repeated.
         self._live_problem_rows_written = set()
         self.live_paths = live_paths or {}
+        # Linked-ISBNs snapshot rewrites run on a private single-thread pool so the
+        # full-table dump never blocks the per-ISBN callback path.  At most one
+        # refresh is queued at a time; requests arriving meanwhile fold into it.
+        self._linked_pool = QThreadPool()
+        self._linked_pool.setMaxThreadCount(1)
+        self._linked_refresh_lock = threading.Lock()
+        self._linked_refresh_queued = False
+        self._linked_snapshot_active = False
         # Session-level result lists; snapshotted by HarvestTab._on_complete at run end.
         self._session_success = []
         self._session_failed = []
@@ -547,12 +599,9 @@ class HarvestWorker(QThread):
                 "run_stats": self.run_stats,
             }
 
-            self.status_message.emit(
-                messages.HarvestMessages.harvest_completed.format(
-                    successes=summary.successes,
-                    failures=summary.failures,
-                )
-            )
+            # No separate "completed" status_message: HarvestTab._on_complete writes
+            # the final log line (including these counts) from final_stats, and a
+            # status emitted just before it would be overwritten unpainted.
             self.harvest_complete.emit(True, final_stats)
 
         except HarvestCancelled:
@@ -576,18 +625,19 @@ class HarvestWorker(QThread):
             )
         finally:
             self._close_live_result_files()
+            self._finish_linked_snapshot()
 
     def _update_processed(self):
         """Increment the processed-ISBN counter and emit stats at regular intervals.
 
         Emits ``stats_update`` every 5 ISBNs and on the final ISBN so the dashboard
         KPI cards stay in sync without a per-ISBN DB round-trip.
-        Also refreshes the live linked-ISBNs snapshot file on each call.
+        Also schedules a background refresh of the live linked-ISBNs snapshot file.
         """
         self.processed_count += 1
         self.run_stats.processed_unique = self.processed_count
         # Keep the linked-ISBNs TSV/CSV snapshot current throughout the run.
-        self._refresh_live_linked_isbns_file()
+        self._schedule_linked_snapshot_refresh()
 
         # Emit every 5 ISBNs or at the very end to balance update frequency vs overhead.
         if self.processed_count % 5 == 0 or self.processed_count == getattr(self.run_stats, "valid_rows", 0):
@@ -620,6 +670,34 @@ class HarvestWorker(QThread):
             handle.flush()
             self._live_result_handles[key] = handle
         self._refresh_live_linked_isbns_file()
+        self._linked_snapshot_active = True
+
+    def _schedule_linked_snapshot_refresh(self):
+        """Queue a linked-ISBNs snapshot rewrite on the background pool.
+
+        No-op while a refresh is already queued; that pending job will read the
+        latest table state when it runs.
+        """
+        if not self.live_paths.get("linked"):
+            return
+        with self._linked_refresh_lock:
+            if self._linked_refresh_queued:
+                return
+            self._linked_refresh_queued = True
+        self._linked_pool.start(self._run_queued_linked_refresh)
+
+    def _run_queued_linked_refresh(self):
+        """Pool job: clear the queued flag first so later changes re-queue, then rewrite."""
+        with self._linked_refresh_lock:
+            self._linked_refresh_queued = False
+        self._refresh_live_linked_isbns_file()
+
+    def _finish_linked_snapshot(self):
+        """Drain pending background refreshes and write one final snapshot."""
+        self._linked_pool.waitForDone()
+        if self._linked_snapshot_active:
+            self._refresh_live_linked_isbns_file()
+            self._linked_snapshot_active = False
 
     def _close_live_result_files(self):
         """Flush and close all live TSV file handles.
@@ -659,32 +737,45 @@ class HarvestWorker(QThread):
         """Rewrite the linked-ISBNs snapshot file from the current DB state.
 
         Called after every processed ISBN so the file stays current during a long
-        harvest. The TSV snapshot is written atomically (full rewrite, not
-        append) because the table can change between calls.
+        harvest. The TSV snapshot is written atomically (full rewrite into a
+        temporary sibling, then renamed over the old file) because the table
+        can change between calls.  Rows are streamed straight from the cursor
+        into the writer, so memory use does not grow with the table.
         """
         linked_path_raw = self.live_paths.get("linked")
         if not linked_path_raw:
             return
         linked_path = Path(linked_path_raw)
         linked_path.parent.mkdir(parents=True, exist_ok=True)
-        rows = []
+        tmp_path = linked_path.with_name(linked_path.name + ".tmp")
+        header = ["ISBN", "Canonical ISBN"]
         try:
-            db = DatabaseManager(self.db_path)
-            with db.connect() as conn:
-                rows = conn.execute(
-                    "SELECT other_isbn AS isbn, lowest_isbn AS canonical_isbn "
-                    "FROM linked_isbns ORDER BY lowest_isbn, other_isbn"
-                ).fetchall()
-        except Exception:
-            rows = []
-
-        try:
-            with open(linked_path, "w", newline="", encoding="utf-8-sig") as handle:
+            db = self._db
+            with db.connect() as conn, open(
+                tmp_path, "w", newline="", encoding="utf-8-sig", buffering=_EXPORT_BUFFER_SIZE
+            ) as handle:
+                # Plain tuples are all csv.writer needs; skip building sqlite3.Row objects.
+                conn.row_factory = None
                 writer = csv.writer(handle, delimiter="\t")
-                writer.writerow(["ISBN", "Canonical ISBN"])
-                writer.writerows(rows)
+                writer.writerow(header)
+                writer.writerows(
+                    conn.execute(
+                        "SELECT other_isbn AS isbn, lowest_isbn AS canonical_isbn "
+                        "FROM linked_isbns ORDER BY lowest_isbn, other_isbn"
+                    )
+                )
+            tmp_path.replace(linked_path)
         except Exception:
-            pass
+            tmp_path.unlink(missing_ok=True)
+            # Keep the last good snapshot; only fall back to a header-only file
+            # when nothing has been written yet.
+            if linked_path.exists():
+                return
+            try:
+                with open(linked_path, "w", newline="", encoding="utf-8-sig") as handle:
+                    csv.writer(handle, delimiter="\t").writerow(header)
+            except Exception:
+                pass
 
     def _successful_headers(self):
         """Return the correct column headers for the successful-results TSV based on the active mode.
@@ -993,14 +1084,15 @@ class HarvestWorker(QThread):
     def _read_and_validate_isbns(self):
         """Parse ``self.input_file`` and emit a status message for any invalid ISBNs.
 
-        Delegates to ``parse_isbn_file`` from ``src.harvester.run_harvest``.
+        Delegates to ``parse_isbn_file_cached`` from ``src.harvester.run_harvest``,
+        so a file already parsed by the harvest tab is not read again.
 
         Returns:
             A ``ParsedISBNFile`` object on success, or ``None`` if the file could
             not be read (error message emitted via ``status_message``).
         """
         try:
-            parsed = parse_isbn_file(Path(self.input_file))
+            parsed = parse_isbn_file_cached(Path(self.input_file))
             if parsed.invalid_isbns:
                 self.status_message.emit(
                     messages.HarvestMessages.invalid_isbns_count.format(
@@ -1027,7 +1119,7 @@ class HarvestWorker(QThread):
             return
 
         try:
-            db = DatabaseManager(self.db_path)
+            db = self._db
             with db.transaction() as conn:
                 for raw_isbn in invalid_list:
                     conn.execute(
@@ -1117,14 +1209,16 @@ class HarvestWorker(QThread):
         Returns:
             ``True`` if the harvest should be cancelled, ``False`` to continue.
         """
-        import time
-
         # Block here while the user has paused the harvest.
         while self._pause_requested and not self._stop_requested:
             time.sleep(0.1)
         return self._stop_requested
 
 
+# Input-file suffixes accepted by DroppableGroupBox when none are given.
+_DEFAULT_INPUT_EXTENSIONS = frozenset({".tsv", ".txt", ".csv", ".xlsx", ".xls"})
+
+
 class DroppableGroupBox(QGroupBox):
     """A ``QGroupBox`` that accepts drag-and-drop of harvest input files.
 
@@ -1146,10 +1240,17 @@ class DroppableGroupBox(QGroupBox):
         self.setAcceptDrops(True)
         self.setObjectName("DroppableArea")
         self.setProperty("dropState", "normal")
-        self._accepted_extensions = tuple(
-            ext.lower() for ext in (accepted_extensions or (".tsv", ".txt", ".csv", ".xlsx", ".xls"))
+        # Suffix set for O(1) membership checks in dropEvent.
+        self._accepted_extensions = frozenset(
+            ext.lower() for ext in (accepted_extensions or _DEFAULT_INPUT_EXTENSIONS)
         )
         self._invalid_message = invalid_message or "Please drop a valid TSV, TXT, CSV, or Excel file."
+        # One restartable timer ends the "dropped" flash; back-to-back drops
+        # extend it instead of stacking resets that fire mid-flash.
+        self._reset_timer = QTimer(self)
+        self._reset_timer.setSingleShot(True)
+        self._reset_timer.setInterval(500)
+        self._reset_timer.timeout.connect(lambda: self._update_state("normal"))
 
     def _update_state(self, state: str):
         """Update the ``dropState`` property and force a QSS re-polish.
@@ -1157,6 +1258,9 @@ class DroppableGroupBox(QGroupBox):
         Args:
             state: One of ``"normal"``, ``"hover"``, or ``"dropped"``.
         """
+        # Skip the re-polish when the state is unchanged (repeated drag events).
+        if self.property("dropState") == state:
+            return
         self.setProperty("dropState", state)
         # unpolish/polish forces Qt to re-evaluate the QSS [dropState="..."] selector.
         self.style().unpolish(self)
@@ -1168,6 +1272,8 @@ class DroppableGroupBox(QGroupBox):
             for url in event.mimeData().urls():
                 if url.toLocalFile():
                     event.acceptProposedAction()
+                    # A pending flash reset must not clear the hover state.
+                    self._reset_timer.stop()
                     # Switch to "hover" so QSS can apply a drag-over highlight.
                     self._update_state("hover")
                     return
@@ -1181,14 +1287,14 @@ class DroppableGroupBox(QGroupBox):
     def dropEvent(self, event: QDropEvent):
         files = [url.toLocalFile() for url in event.mimeData().urls()]
         # Filter to recognised input-file extensions only.
-        valid_files = [path for path in files if path.lower().endswith(self._accepted_extensions)]
+        valid_files = [path for path in files if Path(path).suffix.lower() in self._accepted_extensions]
 
         if valid_files:
             # Emit the first valid file and briefly show the "dropped" state for visual feedback.
             self.file_dropped.emit(valid_files[0])
             self._update_state("dropped")
             # Reset to normal after 500 ms so the group box does not stay highlighted.
-            QTimer.singleShot(500, lambda: self._update_state("normal"))
+            self._reset_timer.start()
             event.acceptProposedAction()
             return
 
@@ -48,16 +48,19 @@ from PyQt6.QtWidgets import (
     QDialog,
     QCheckBox,
 )
-from datetime import datetime, timezone
-from PyQt6.QtCore import Qt, QTimer, QTime, pyqtSignal, QSize, QUrl
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from PyQt6.QtCore import Qt, QThreadPool, QTimer, pyqtSignal, QSize, QUrl
 from PyQt6.QtGui import QShortcut, QKeySequence, QColor, QBrush, QDesktopServices
 from pathlib import Path
 from enum import Enum, auto
-from itertools import islice
 import csv
 import hashlib
+import logging
+import sqlite3
 import sys
 import json
+import time
 
 from .combo_boxes import ConsistentComboBox
 from .icons import SVG_HARVEST, SVG_INPUT, SVG_ACTIVITY
@@ -65,19 +68,24 @@ from .input_tab import ClickableDropZone
 from .harvest_support import (
     DroppableGroupBox,
     HarvestWorker,
+    _EXPORT_BUFFER_SIZE,
     _extract_lc_classification,
     _looks_like_header_cell,
+    _BackgroundJob,
     _prepare_marc_import_records,
     _safe_filename,
 )
 
 from src.harvester.marc_import import MarcImportService
-from src.harvester.run_harvest import parse_isbn_file
+from src.harvester.run_harvest import _INPUT_READ_BUFFER_SIZE, parse_isbn_file_cached
 from src.database import DatabaseManager, now_datetime_str
 from src.config.profile_manager import ProfileManager
+from src.utils import messages
 from src.utils.isbn_validator import normalize_isbn
 from .theme_manager import ThemeManager
 
+logger = logging.getLogger(__name__)
+
 
 def _friendly_error(exc: Exception) -> str:
     """Convert a technical exception into a plain-language message for end users."""
@@ -117,6 +125,35 @@ class UIState(Enum):
     CANCELLED = auto()  # User cancelled the run mid-flight.
 
 
+@dataclass(frozen=True)
+class _StateStyle:
+    """Static presentation for one ``UIState`` (see ``_STATE_STYLES``)."""
+
+    prop: str                # Value of the QSS "state" property on banner and pill.
+    title: str               # Banner title text.
+    status: str              # Run-status pill text.
+    show_start: bool = False
+    show_new_run: bool = False
+    active: bool = False     # RUNNING/PAUSED: Pause + Cancel visible, is_running True.
+    pause_text: str = "Pause"
+
+
+_STATE_STYLES = {
+    UIState.IDLE: _StateStyle("idle", "READY", "Idle", show_start=True),
+    UIState.READY: _StateStyle("ready", "READY", "Ready", show_start=True),
+    UIState.RUNNING: _StateStyle("running", "RUNNING", "Running", active=True),
+    UIState.PAUSED: _StateStyle("paused", "PAUSED", "Paused", active=True, pause_text="Resume"),
+    UIState.ERROR: _StateStyle("error", "ERROR", "Error", show_start=True),
+    UIState.COMPLETED: _StateStyle("completed", "COMPLETED", "Completed", show_new_run=True),
+    UIState.CANCELLED: _StateStyle("cancelled", "CANCELLED", "Cancelled", show_new_run=True),
+}
+
+_PAUSE_BUTTON_QSS = (
+    "background-color: #f97316; color: #ffffff; border: 1px solid #ea580c; "
+    "border-radius: 10px; font-weight: 700; padding: 8px 16px;"
+)
+
+
 class HarvestTab(QWidget):
     """Harvest execution page widget.
 
@@ -156,10 +193,23 @@ class HarvestTab(QWidget):
     live_result_ready = pyqtSignal(dict)
     # Emitted every 5 ISBNs with a RunStats dataclass for live KPI card updates.
     live_stats_ready = pyqtSignal(object)
+    # True while a MARC import is writing to the database; the main window
+    # locks profile controls and refuses to close until it is False again.
+    marc_import_active = pyqtSignal(bool)
 
     # Reserved for future delegation of the start action to the main window.
     request_start_harvest = pyqtSignal()
 
+    # Maximum number of files whose parsed preview rows are kept in _preview_cache.
+    _PREVIEW_CACHE_SIZE = 8
+    # Minimum milliseconds between progress counter/bar repaints from _on_stats.
+    _STATS_PAINT_INTERVAL_MS = 50
+    # Inline DB-only checkbox styles per theme, built once instead of per toggle.
+    _DB_ONLY_CHECKBOX_STYLES = {
+        "dark": "QCheckBox { color: #f9fafb; font-weight: 600; spacing: 8px; }",
+        "light": "QCheckBox { color: #000000; font-weight: 600; spacing: 8px; }",
+    }
+
     def __init__(self):
         """Initialise instance variables and build the UI.
 
@@ -181,6 +231,14 @@ class HarvestTab(QWidget):
         self.current_state = UIState.IDLE
         self.input_file = None  # Absolute path string of the currently loaded ISBN file.
         self._marc_selected_path = None
+        # True from the MARC overlap check until the database write has finished.
+        self.marc_import_running = False
+        # Whether this tab currently holds the app-wide wait cursor.
+        self._marc_wait_cursor = False
+        # Pool job for the in-flight MARC database write and the values its
+        # finished slot needs to write the TSV export and summary.
+        self._marc_job = None
+        self._marc_import_ctx = None
         # Session snapshots copied from the worker at harvest completion for later inspection.
         self._last_session_success = []
         self._last_session_failed = []
@@ -192,6 +250,11 @@ class HarvestTab(QWidget):
         self._targets_getter = None  # () -> list[dict]
         self._profile_getter = None  # () -> str
         self._db_path_getter = None  # () -> str | Path
+        # ((st_mtime_ns, st_size), settings) for data/advanced_settings.json so
+        # repeated Start clicks skip the re-read when the file is unchanged.
+        self._adv_cache = None
+        # Parsed preview rows keyed by (path, st_mtime_ns); see _load_file_preview.
+        self._preview_cache = {}
 
         self.processed_count = 0  # ISBNs processed so far in the current run.
         self.total_count = 0       # Total unique valid ISBNs in the loaded file.
@@ -239,6 +302,45 @@ class HarvestTab(QWidget):
             return
         self._check_start_conditions()
 
+    @staticmethod
+    def _create_stat_tile(label_text, small=False):
+        """Build one stat tile (value over caption) styled via class properties.
+
+        All tiles share the global ``StatTile`` / ``StatTileValue`` /
+        ``StatTileLabel`` QSS rules, so no per-widget stylesheet is parsed.
+
+        Args:
+            label_text: Caption shown under the value.
+            small: Use the compact MARC-card variant (``*Small`` classes).
+
+        Returns:
+            ``(tile, value_label)`` — the container widget and the value ``QLabel``.
+        """
+        suffix = "Small" if small else ""
+        tile = QWidget()
+        tile.setSizePolicy(
+            QSizePolicy.Policy.Expanding,
+            QSizePolicy.Policy.Preferred if small else QSizePolicy.Policy.Expanding,
+        )
+        tile.setProperty("class", "StatTile")
+        tile_layout = QVBoxLayout(tile)
+        if small:
+            tile_layout.setContentsMargins(10, 10, 10, 10)
+            tile_layout.setSpacing(3)
+        else:
+            tile_layout.setContentsMargins(14, 14, 14, 12)
+            tile_layout.setSpacing(4)
+        tile_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        lbl_val = QLabel("—")
+        lbl_val.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        lbl_val.setProperty("class", f"StatTileValue{suffix}")
+        lbl_cat = QLabel(label_text)
+        lbl_cat.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        lbl_cat.setProperty("class", f"StatTileLabel{suffix}")
+        tile_layout.addWidget(lbl_val)
+        tile_layout.addWidget(lbl_cat)
+        return tile, lbl_val
+
     def _setup_ui(self):
         """Build the full harvest-tab UI.
 
@@ -302,7 +404,7 @@ class HarvestTab(QWidget):
 
         # ── LEFT: Run Setup card ───────────────────────────────────────────────
         self.input_card = DroppableGroupBox("Run Setup")
-        self.input_card.file_dropped.connect(self.set_input_file)
+        self.input_card.file_dropped.connect(self._queue_input_file)
         self.input_card.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
         input_layout = QVBoxLayout(self.input_card)
         input_layout.setContentsMargins(16, 10, 16, 10)
@@ -411,21 +513,7 @@ class HarvestTab(QWidget):
             ("Unmatched",     "_marc_stat_unmatched"),
         ]
         for label_text, attr_name in marc_stat_defs:
-            tile = QWidget()
-            tile.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-            tile.setProperty("class", "StatTile")
-            tile_vbox = QVBoxLayout(tile)
-            tile_vbox.setContentsMargins(10, 10, 10, 10)
-            tile_vbox.setSpacing(3)
-            tile_vbox.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            lbl_val = QLabel("—")
-            lbl_val.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            lbl_val.setProperty("class", "StatTileValueSmall")
-            lbl_cat = QLabel(label_text)
-            lbl_cat.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            lbl_cat.setProperty("class", "StatTileLabelSmall")
-            tile_vbox.addWidget(lbl_val)
-            tile_vbox.addWidget(lbl_cat)
+            tile, lbl_val = self._create_stat_tile(label_text, small=True)
             marc_stat_row.addWidget(tile)
             setattr(self, attr_name, lbl_val)
         marc_vbox.addLayout(marc_stat_row)
@@ -500,21 +588,7 @@ class HarvestTab(QWidget):
         ]
 
         for label_text, attr_name, row_idx, col_idx in stat_defs:
-            tile = QWidget()
-            tile.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-            tile.setProperty("class", "StatTile")
-            tile_layout = QVBoxLayout(tile)
-            tile_layout.setContentsMargins(14, 14, 14, 12)
-            tile_layout.setSpacing(4)
-            tile_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            lbl_val = QLabel("—")
-            lbl_val.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            lbl_val.setProperty("class", "StatTileValue")
-            lbl_cat = QLabel(label_text)
-            lbl_cat.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            lbl_cat.setProperty("class", "StatTileLabel")
-            tile_layout.addWidget(lbl_val)
-            tile_layout.addWidget(lbl_cat)
+            tile, lbl_val = self._create_stat_tile(label_text)
             stats_grid.addWidget(tile, row_idx, col_idx)
             setattr(self, attr_name, lbl_val)
 
@@ -575,13 +649,31 @@ class HarvestTab(QWidget):
         self.lbl_run_elapsed = QLabel("00:00:00")
         self.lbl_run_elapsed.setProperty("class", "ActivityValue")
 
-        # Elapsed-time timer: fires every 1 000 ms to increment lbl_run_elapsed.
-        # timer_is_paused stops the count while the harvest is paused.
+        # Elapsed-time timer: ticks every 500 ms and derives lbl_run_elapsed from a
+        # monotonic start stamp, so dropped or late ticks never skew the display.
+        # Time spent paused is accumulated in _run_paused_accum and excluded.
         self.run_timer = QTimer(self)
+        self.run_timer.setInterval(500)
         self.run_timer.timeout.connect(self._update_timer)
-        self.run_time = QTime(0, 0, 0)
+        self._run_t0 = 0.0
+        self._run_paused_accum = 0.0
+        self._run_pause_t0 = None
         self.timer_is_paused = False
 
+        # Debounce for drag/drop selections: rapid successive drops only
+        # parse the last file once the user settles (see _queue_input_file).
+        self._pending_path = None
+        self._parse_debounce = QTimer(self)
+        self._parse_debounce.setSingleShot(True)
+        self._parse_debounce.timeout.connect(self._flush_pending_input_file)
+
+        # Trailing throttle for the progress counter and bar: _on_stats only
+        # records counts, and this timer paints the newest ones once per window.
+        self._stats_paint_timer = QTimer(self)
+        self._stats_paint_timer.setSingleShot(True)
+        self._stats_paint_timer.setInterval(self._STATS_PAINT_INTERVAL_MS)
+        self._stats_paint_timer.timeout.connect(self._flush_stats_paint)
+
         # ── 5. Action Bar ──────────────────────────────────────────────────────
         action_frame = QFrame()
         action_frame.setProperty("class", "Card")
@@ -741,125 +833,59 @@ class HarvestTab(QWidget):
                       display the ISBN count on the Start button).
         """
         self.current_state = state
-
-        # Default all action buttons to hidden/disabled
-        self.btn_start.setVisible(False)
-        self.btn_pause.setVisible(False)
-        self.btn_stop.setVisible(False)
-        self.btn_new_run.setVisible(False)
+        style = _STATE_STYLES[state]
 
         # Update is_running flag based on state
-        self.is_running = state in (UIState.RUNNING, UIState.PAUSED)
-
-        bg_color = "#181926"
-        left_color = "#45475a"
-        text_color = "#cad3f5"
-        title_text = "READY"
-        show_stats = False
-
-        if state == UIState.IDLE:
-            self.banner_frame.setProperty("state", "idle")
-            self.lbl_run_status.setProperty("state", "idle")
-            self.lbl_banner_title.setProperty("state", "idle")
-            title_text = "READY"
-
-            self.lbl_run_status.setText("Idle")
-
-            self.btn_start.setVisible(True)
-            self.btn_start.setEnabled(False)
-            self.btn_start.setText("Start Harvest")
-
-        elif state == UIState.READY:
-            self.banner_frame.setProperty("state", "ready")
-            self.lbl_run_status.setProperty("state", "ready")
-            self.lbl_banner_title.setProperty("state", "ready")
-            title_text = "READY"
-
-            self.lbl_run_status.setText("Ready")
-
-            self.btn_start.setVisible(True)
-            self.btn_start.setEnabled(True)
-            count = kwargs.get("count", "?")
-            self.btn_start.setText(f"Start Harvest ({count} ISBNs)")
-
-        elif state == UIState.RUNNING:
-            self.banner_frame.setProperty("state", "running")
-            self.lbl_run_status.setProperty("state", "running")
-            self.lbl_banner_title.setProperty("state", "running")
-            title_text = "RUNNING"
-
-            self.lbl_run_status.setText("Running")
-
-                # Revert any terminal-state colour (green/red) back to the default "running" style.
-            self.progress_bar.setProperty("state", "running")
-            self.progress_bar.style().unpolish(self.progress_bar)
-            self.progress_bar.style().polish(self.progress_bar)
+        self.is_running = style.active
+
+        # Buttons: Start for idle/ready/error, Pause+Cancel while active,
+        # New Harvest once a run has finished or been cancelled.
+        self.btn_start.setVisible(style.show_start)
+        if style.show_start:
+            self.btn_start.setEnabled(state == UIState.READY and not self.marc_import_running)
+            if state == UIState.READY:
+                self.btn_start.setText(f"Start Harvest ({kwargs.get('count', '?')} ISBNs)")
+            else:
+                self.btn_start.setText("Start Harvest")
 
-            self.btn_pause.setVisible(True)
+        self.btn_pause.setVisible(style.active)
+        self.btn_stop.setVisible(style.active)
+        if style.active:
             self.btn_pause.setEnabled(True)
-            self.btn_pause.setText("Pause")
-            self.btn_pause.setStyleSheet(
-                "background-color: #f97316; color: #ffffff; border: 1px solid #ea580c; border-radius: 10px; font-weight: 700; padding: 8px 16px;"
-            )
-            self.btn_stop.setVisible(True)
+            self.btn_pause.setText(style.pause_text)
+            self.btn_pause.setStyleSheet(_PAUSE_BUTTON_QSS)
             self.btn_stop.setEnabled(True)
+        else:
+            # Clear the inline orange style on the Pause button when we leave the active states.
+            self.btn_pause.setStyleSheet("")
 
-        elif state == UIState.PAUSED:
-            self.banner_frame.setProperty("state", "paused")
-            self.lbl_run_status.setProperty("state", "paused")
-            self.lbl_banner_title.setProperty("state", "paused")
-            
-            title_text = "PAUSED"
-            self.lbl_run_status.setText("Paused")
+        self.btn_new_run.setVisible(style.show_new_run)
 
-            self.btn_pause.setVisible(True)
-            self.btn_pause.setEnabled(True)
-            self.btn_pause.setText("Resume")
-            self.btn_pause.setStyleSheet(
-                "background-color: #f97316; color: #ffffff; border: 1px solid #ea580c; border-radius: 10px; font-weight: 700; padding: 8px 16px;"
-            )
-            self.btn_stop.setVisible(True)
-            self.btn_stop.setEnabled(True)
+        if state == UIState.RUNNING:
+            # Revert any terminal-state colour (green/red) back to the default "running" style.
+            self._set_state_property(self.progress_bar, "running")
 
-        elif state == UIState.ERROR:
-            self.banner_frame.setProperty("state", "error")
-            self.lbl_run_status.setProperty("state", "error")
-            self.lbl_banner_title.setProperty("state", "error")
-            
-            title_text = "ERROR"
-            self.lbl_run_status.setText("Error")
+        # Force QSS to re-evaluate the "state" property on the banner and pill labels;
+        # widgets whose property did not change are skipped.
+        for widget in (self.banner_frame, self.lbl_run_status, self.lbl_banner_title):
+            self._set_state_property(widget, style.prop)
 
-            self.btn_start.setVisible(True)
-            self.btn_start.setEnabled(False)
-            self.btn_start.setText("Start Harvest")
-
-        elif state in (UIState.COMPLETED, UIState.CANCELLED):
-            is_success = state == UIState.COMPLETED
-            state_prop = "completed" if is_success else "cancelled"
-            
-            self.banner_frame.setProperty("state", state_prop)
-            self.lbl_run_status.setProperty("state", state_prop)
-            self.lbl_banner_title.setProperty("state", state_prop)
-            
-            title_text = "COMPLETED" if is_success else "CANCELLED"
-            self.lbl_run_status.setText("Completed" if is_success else "Cancelled")
-
-            self.btn_new_run.setVisible(True)
-
-        # Force QSS to re-evaluate the "state" property on the banner and pill labels.
-        # unpolish + polish is the canonical way to refresh dynamic-property-driven QSS rules.
-        self.banner_frame.style().unpolish(self.banner_frame)
-        self.banner_frame.style().polish(self.banner_frame)
-        self.lbl_run_status.style().unpolish(self.lbl_run_status)
-        self.lbl_run_status.style().polish(self.lbl_run_status)
-        self.lbl_banner_title.style().unpolish(self.lbl_banner_title)
-        self.lbl_banner_title.style().polish(self.lbl_banner_title)
-        # Clear the inline orange style on the Pause button when we leave the active states.
-        if state not in (UIState.RUNNING, UIState.PAUSED):
-            self.btn_pause.setStyleSheet("")
+        self.lbl_run_status.setText(style.status)
+        self.lbl_banner_title.setText(style.title)
+        self.lbl_banner_stats.setVisible(False)
 
-        self.lbl_banner_title.setText(title_text)
-        self.lbl_banner_stats.setVisible(show_stats)
+    @staticmethod
+    def _set_state_property(widget, value):
+        """Set the dynamic ``state`` property and re-polish only when it changes.
+
+        unpolish + polish is the canonical way to refresh dynamic-property-driven
+        QSS rules, but it is not free, so repeated identical values are skipped.
+        """
+        if widget.property("state") == value:
+            return
+        widget.setProperty("state", value)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
 
     def _setup_shortcuts(self):
         """Register keyboard shortcuts for common harvest actions.
@@ -886,10 +912,26 @@ class HarvestTab(QWidget):
         if event.type() == event.Type.WindowStateChange:
             self._update_scrollbar_policy()
 
+    def _queue_input_file(self, path):
+        """Schedule ``set_input_file`` for *path* after a short debounce.
+
+        Drag/drop selections route through here so a quick series of drops
+        parses only the final file.  ``set_input_file`` itself stays
+        synchronous for programmatic callers.
+        """
+        self._pending_path = path
+        self._parse_debounce.start(150)
+
+    def _flush_pending_input_file(self):
+        """Load the most recently queued input file (debounce timeout slot)."""
+        path, self._pending_path = self._pending_path, None
+        if path:
+            self.set_input_file(path)
+
     def set_input_file(self, path):
         """Load an ISBN input file, validate it, and update all related UI controls.
 
-        Parses the file with ``parse_isbn_file`` (sampling the first 200 k lines for
+        Parses the file with ``parse_isbn_file_cached`` (sampling the first 200 k lines for
         files > 20 MB), populates the File Statistics tiles, runs the preview table,
         and calls ``_check_start_conditions`` to decide whether to enable Start.
 
@@ -899,6 +941,10 @@ class HarvestTab(QWidget):
         Args:
             path: Absolute path string, or empty/``None`` to clear the current file.
         """
+        # The running worker already holds its input; never swap it mid-run.
+        if self.current_state in (UIState.RUNNING, UIState.PAUSED):
+            return
+
         if not path:
             self._clear_input()
             return
@@ -917,13 +963,15 @@ class HarvestTab(QWidget):
 
         # Content Check (Real Validation)
         try:
-            size_kb = path_obj.stat().st_size / 1024
+            # One stat() serves the size tile, the sampling decision, and the preview cache key.
+            st = path_obj.stat()
+            size_kb = st.st_size / 1024
             # For files larger than 20 MB, parse only the first 200 k lines to keep the UI responsive.
-            sampled = path_obj.stat().st_size > 20 * 1024 * 1024  # 20 MB threshold
+            sampled = st.st_size > 20 * 1024 * 1024  # 20 MB threshold
             INFO_SAMPLE_MAX_LINES = 200_000
 
-            parsed = parse_isbn_file(
-                path_obj, max_lines=INFO_SAMPLE_MAX_LINES if sampled else 0
+            parsed = parse_isbn_file_cached(
+                path_obj, max_lines=INFO_SAMPLE_MAX_LINES if sampled else 0, st=st
             )
 
             unique_valid = len(parsed.unique_valid)
@@ -979,7 +1027,7 @@ class HarvestTab(QWidget):
 
             self.file_path_edit.setText(path_obj.name)
             self.btn_clear_file.setVisible(True)
-            self._load_file_preview()
+            self._load_file_preview(mtime_ns=st.st_mtime_ns)
 
             self._check_start_conditions(unique_valid)
 
@@ -1023,61 +1071,6 @@ class HarvestTab(QWidget):
 
         self._transition_state(UIState.READY, count=count)
 
-    def _load_file_preview(self):
-        """Load a snippet of the file into the preview table."""
-        self.preview_table.clearContents()
-        self.preview_table.setRowCount(0)
-        if not self.input_file:
-            return
-
-        path_obj = Path(self.input_file)
-        if not path_obj.exists():
-            self._show_preview_message("Error: File does not exist.")
-            return
-
-        try:
-            with open(path_obj, "r", encoding="utf-8-sig") as f:
-                raw_lines = list(islice(f, 21))
-
-            truncated = len(raw_lines) == 21
-            lines = raw_lines[:20]
-            rows = [ln.rstrip("\n\r").split("\t") for ln in lines]
-            if not rows:
-                return
-
-            max_cols = max(len(r) for r in rows)
-            # Columns: data cols + Status
-            self.preview_table.setColumnCount(max_cols + 1)
-            self.preview_table.setRowCount(len(rows))
-            headers = [f"Col {i + 1}" for i in range(max_cols)] + ["Status"]
-            self.preview_table.setHorizontalHeaderLabels(headers)
-
-            for r, row in enumerate(rows):
-                for c, cell in enumerate(row):
-                    item = QTableWidgetItem(cell.strip())
-                    self.preview_table.setItem(r, c, item)
-                # Status: validate first cell as ISBN
-                raw = row[0].strip() if row else ""
-                is_valid = bool(normalize_isbn(raw.replace("-", "")))
-                status_item = QTableWidgetItem("✓ Valid" if is_valid else "✗ Invalid")
-                status_item.setForeground(
-                    QBrush(QColor("#22c55e" if is_valid else "#ef4444"))
-                )
-                self.preview_table.setItem(r, max_cols, status_item)
-
-            # Stretch the first data column, fit-to-content for status
-            self.preview_table.horizontalHeader().setSectionResizeMode(
-                0, QHeaderView.ResizeMode.Stretch
-            )
-            self.preview_table.horizontalHeader().setSectionResizeMode(
-                max_cols, QHeaderView.ResizeMode.ResizeToContents
-            )
-
-            name = path_obj.name + (" (first 20 rows)" if truncated else "")
-            self.lbl_preview_filename.setText(name)
-        except Exception as e:
-            self._show_preview_message("Could not load preview.")
-
     def _show_preview_message(self, msg: str):
         """Show a single-cell message in the preview table."""
         self.preview_table.setColumnCount(1)
@@ -1091,21 +1084,25 @@ class HarvestTab(QWidget):
         ``QCheckBox`` text colour can be overridden by global QSS rules that make it
         invisible on certain themes; this method ensures the label is always readable
         by reading the active theme from ``ThemeManager`` and applying an explicit
-        inline style.
+        inline style.  The stylesheet is only re-set when the theme actually
+        changed, since each ``setStyleSheet`` call re-parses the QSS and
+        repolishes the widget.
         """
-        is_dark = ThemeManager().get_theme() == "dark"
-        text_color = "#f9fafb" if is_dark else "#000000"
-        self.chk_db_only.setStyleSheet(
-            "QCheckBox { color: " + text_color + "; font-weight: 600; spacing: 8px; }"
-        )
+        style = self._DB_ONLY_CHECKBOX_STYLES[ThemeManager().get_theme()]
+        if self.chk_db_only.styleSheet() != style:
+            self.chk_db_only.setStyleSheet(style)
 
-    def _load_file_preview(self):
+    def _load_file_preview(self, mtime_ns=None):
         """Populate the preview table with the first 20 valid ISBN rows from the input file.
 
         Reads lines one at a time, normalises the first column as an ISBN, skips a
         recognised header row (via ``_looks_like_header_cell``), and stops once 20
         rows have been collected.  Each row shows the raw cell text and a colour-coded
         "Valid"/"Invalid" status in the second column.
+
+        Args:
+            mtime_ns: The file's ``st_mtime_ns`` when the caller has already
+                stat'ed it; otherwise the file is stat'ed here.
         """
         self.preview_table.clearContents()
         self.preview_table.setRowCount(0)
@@ -1113,39 +1110,27 @@ class HarvestTab(QWidget):
             return
 
         path_obj = Path(self.input_file)
-        if not path_obj.exists():
-            self._show_preview_message("Error: File does not exist.")
-            return
+        if mtime_ns is None:
+            try:
+                mtime_ns = path_obj.stat().st_mtime_ns
+            except OSError:
+                self._show_preview_message("Error: File does not exist.")
+                return
 
         try:
-            preview_rows = []
-            total_read = 0
-            skipped_header = False
-
-            with open(path_obj, "r", encoding="utf-8-sig") as handle:
-                for line in handle:
-                    total_read += 1
-                    row = line.rstrip("\n\r").split("\t")
-                    first_cell = row[0].strip() if row else ""
-                    if not first_cell:
-                        continue
-
-                    normalized = normalize_isbn(first_cell.replace("-", ""))
-                    if normalized:
-                        preview_rows.append((row, True))
-                    elif not skipped_header and _looks_like_header_cell(first_cell):
-                        skipped_header = True
-                        continue
-                    else:
-                        preview_rows.append((row, False))
-
-                    if len(preview_rows) >= 20:
-                        break
+            cache_key = (str(path_obj), mtime_ns)
+            cached = self._preview_cache.pop(cache_key, None)
+            if cached is None:
+                cached = self._read_preview_rows(path_obj)
+                if len(self._preview_cache) >= self._PREVIEW_CACHE_SIZE:
+                    self._preview_cache.pop(next(iter(self._preview_cache)))
+            # Re-insert so the dict's insertion order doubles as LRU order.
+            self._preview_cache[cache_key] = cached
+            preview_rows, truncated = cached
 
             if not preview_rows:
                 return
 
-            truncated = total_read > len(preview_rows)
             self.preview_table.setColumnCount(2)
             self.preview_table.setRowCount(len(preview_rows))
             self.preview_table.setHorizontalHeaderLabels(["ISBN", "Status"])
@@ -1164,6 +1149,40 @@ class HarvestTab(QWidget):
         except Exception as e:
             self._show_preview_message("Could not load preview.")
 
+    @staticmethod
+    def _read_preview_rows(path_obj):
+        """Read up to 20 preview rows from *path_obj*.
+
+        Returns:
+            ``(rows, truncated)`` where ``rows`` is a list of ``(cells, is_valid)``
+            tuples and ``truncated`` is ``True`` when more lines were scanned than kept.
+        """
+        preview_rows = []
+        total_read = 0
+        skipped_header = False
+
+        with open(path_obj, "r", encoding="utf-8-sig") as handle:
+            for line in handle:
+                total_read += 1
+                row = line.rstrip("\n\r").split("\t")
+                first_cell = row[0].strip() if row else ""
+                if not first_cell:
+                    continue
+
+                normalized = normalize_isbn(first_cell.replace("-", ""))
+                if normalized:
+                    preview_rows.append((row, True))
+                elif not skipped_header and _looks_like_header_cell(first_cell):
+                    skipped_header = True
+                    continue
+                else:
+                    preview_rows.append((row, False))
+
+                if len(preview_rows) >= 20:
+                    break
+
+        return preview_rows, total_read > len(preview_rows)
+
     def _copy_preview_content(self):
         """Copy the preview table's data columns (excluding Status) to the clipboard as TSV."""
         lines = []
@@ -1192,8 +1211,11 @@ class HarvestTab(QWidget):
         (``log_output``, ``lbl_val_invalid``, ``progress_bar``) via unpolish/polish.
         Emits ``harvest_reset`` to notify the main window to reset the sidebar pill.
         """
+        self._parse_debounce.stop()
+        self._pending_path = None
         self.run_timer.stop()
-        self.run_time = QTime(0, 0, 0)
+        self._run_paused_accum = 0.0
+        self._run_pause_t0 = None
         self.lbl_run_elapsed.setText("00:00:00")
         self.timer_is_paused = False
         self.input_file = None
@@ -1218,8 +1240,8 @@ class HarvestTab(QWidget):
         # Reset clear button
         self.btn_clear_file.setVisible(False)
 
+        self._stats_paint_timer.stop()
         self.lbl_progress_text.setText("0 / 0")
-        self.progress_bar.setValue(0)
         self.log_output.setText("Ready...")
         self.log_output.setProperty("state", "idle")
         self.log_output.style().unpolish(self.log_output)
@@ -1280,6 +1302,7 @@ class HarvestTab(QWidget):
             "All Files (*.*);;Excel Files (*.xlsx *.xls);;TSV Files (*.tsv);;Text Files (*.txt);;CSV Files (*.csv)",
         )
         if file_path:
+            # A modal pick is already a single settled choice; no debounce.
             self.set_input_file(file_path)
 
     def _on_start_clicked(self):
@@ -1295,7 +1318,14 @@ class HarvestTab(QWidget):
            opts to continue (DB-only mode).
         6. Call ``_start_worker``.
         """
-        if not self.input_file:
+        # Load a file dropped within the debounce window now, so the run uses
+        # the last file the user picked and the timer cannot fire mid-run.
+        if self._parse_debounce.isActive():
+            self._parse_debounce.stop()
+            self._flush_pending_input_file()
+
+        # A MARC import writing to the same database must finish first.
+        if not self.input_file or self.marc_import_running:
             return
 
         # 1. Get Config
@@ -1409,7 +1439,8 @@ class HarvestTab(QWidget):
             return
 
         self.run_timer.stop()
-        self.run_time = QTime(0, 0, 0)
+        self._run_paused_accum = 0.0
+        self._run_pause_t0 = None
         self.lbl_run_elapsed.setText("00:00:00")
         self.timer_is_paused = False
 
@@ -1476,24 +1507,28 @@ class HarvestTab(QWidget):
         self.worker.live_result.connect(self.live_result_ready.emit)
 
         self._transition_state(UIState.RUNNING)
-        self.progress_bar.setValue(0)
-        self.progress_bar.setFormat("0/0 (0%)")
+        # The bar's text is hidden (setTextVisible(False)), so only the value matters.
+        if self.progress_bar.value() != 0:
+            self.progress_bar.setValue(0)
 
         self.worker.start()
-        # Elapsed timer fires every 1 000 ms to update lbl_run_elapsed.
-        self.run_timer.start(1000)
+        self._run_t0 = time.monotonic()
+        self.run_timer.start()
 
         self.harvest_started.emit()
 
     def _update_timer(self):
-        """Increment ``run_time`` by one second and refresh the elapsed label.
+        """Refresh the elapsed label from the monotonic run clock.
 
         No-op when the harvest is paused (``timer_is_paused`` is ``True``) so the
         displayed elapsed time freezes during a pause.
         """
-        if not self.timer_is_paused:
-            self.run_time = self.run_time.addSecs(1)
-            self.lbl_run_elapsed.setText(self.run_time.toString("hh:mm:ss"))
+        if self.timer_is_paused:
+            return
+        elapsed = int(time.monotonic() - self._run_t0 - self._run_paused_accum)
+        hours, rem = divmod(max(elapsed, 0), 3600)
+        minutes, seconds = divmod(rem, 60)
+        self.lbl_run_elapsed.setText(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
 
     def _stop_harvest(self):
         """Request a clean cancellation of the running harvest.
@@ -1530,10 +1565,14 @@ class HarvestTab(QWidget):
                 self._transition_state(UIState.PAUSED)
                 self.log_output.setText("Harvest paused. Click Resume to continue.")
                 self.timer_is_paused = True
+                self._run_pause_t0 = time.monotonic()
                 self.harvest_paused.emit(True)
             else:
                 self._transition_state(UIState.RUNNING)
                 self.log_output.setText("Harvest resumed...")
+                if self._run_pause_t0 is not None:
+                    self._run_paused_accum += time.monotonic() - self._run_pause_t0
+                    self._run_pause_t0 = None
                 self.timer_is_paused = False
                 self.harvest_paused.emit(False)
 
@@ -1551,7 +1590,9 @@ class HarvestTab(QWidget):
             return
         input_path = Path(self.input_file)
         delimiter = "," if input_path.suffix.lower() == ".csv" else "\t"
-        with open(input_path, "r", encoding="utf-8-sig", newline="") as f:
+        with open(
+            input_path, "r", encoding="utf-8-sig", newline="", buffering=_INPUT_READ_BUFFER_SIZE
+        ) as f:
             reader = csv.reader(f, delimiter=delimiter)
             for row in reader:
                 raw = (row[0] or "").strip() if row else ""
@@ -1585,6 +1626,12 @@ class HarvestTab(QWidget):
             return set()
 
         try:
+            # Deduplicate once, keeping file order: repeated rows would otherwise be
+            # re-checked and listed (and counted) more than once in the dialog.
+            input_isbns = tuple(dict.fromkeys(self._iter_normalized_input_isbns()))
+            if not input_isbns:
+                # Nothing to check: skip opening (and migrating) the database.
+                return set()
             _db_path = (
                 str(self._db_path_getter())
                 if self._db_path_getter
@@ -1592,23 +1639,18 @@ class HarvestTab(QWidget):
             )
             db = DatabaseManager(_db_path)
             db.init_db()
+            # One batched lookup for the whole file instead of a query per ISBN
+            # (plus another per attempted row for the retry check).
+            attempted_by_isbn = db.get_all_attempted_for_many(input_isbns)
             recent = []
-            for isbn in self._iter_normalized_input_isbns():
-                attempted_rows = db.get_all_attempted_for(isbn)
-                matching_attempts = []
-                for att in attempted_rows:
+            for isbn in input_isbns:
+                for att in attempted_by_isbn.get(isbn, ()):
                     err = (att.last_error or "").lower()
                     if "invalid isbn" in err:
                         continue
-                    if db.should_skip_retry(
-                        isbn,
-                        att.last_target or "",
-                        att.attempt_type or "both",
-                        retry_days=retry_days,
-                    ):
-                        matching_attempts.append(att)
-                if matching_attempts:
-                    recent.append((isbn, matching_attempts[0]))
+                    if DatabaseManager.is_within_retry_window(att.last_attempted, retry_days):
+                        recent.append((isbn, att))
+                        break
         except Exception as e:
             self.log_output.setText(f"Warning: could not check retry window ({e})")
             return set()
@@ -1616,30 +1658,8 @@ class HarvestTab(QWidget):
         if not recent:
             return set()
 
-        details = []
-        for isbn, att in recent:
-            last_attempted = att.last_attempted
-            try:
-                last_val = str(last_attempted) if last_attempted is not None else ""
-                if last_val.isdigit() and len(last_val) == 8:
-                    # Current storage format: yyyymmdd integer stored as text.
-                    last_dt = datetime(int(last_val[:4]), int(last_val[4:6]), int(last_val[6:8]), tzinfo=timezone.utc)
-                elif last_val:
-                    # Legacy storage format: ISO-8601 datetime string.
-                    last_dt = datetime.fromisoformat(last_val)
-                    if last_dt.tzinfo is None:
-                        last_dt = last_dt.replace(tzinfo=timezone.utc)
-                else:
-                    raise ValueError("empty")
-                next_dt = last_dt + timedelta(days=retry_days)
-                next_str = next_dt.astimezone().strftime("%Y-%m-%d")
-                last_str = last_dt.astimezone().strftime("%Y-%m-%d")
-            except Exception:
-                last_str = str(last_attempted) if last_attempted is not None else "Unknown"
-                next_str = "Unknown"
-            details.append(
-                f"{isbn} | last not found: {last_str} | retry after: {next_str}"
-            )
+        retry_delta = timedelta(days=retry_days)
+        details = [self._format_retry_detail(isbn, att, retry_delta) for isbn, att in recent]
         msg = QMessageBox(self)
         msg.setIcon(QMessageBox.Icon.Warning)
         msg.setWindowTitle("Retry Date Not Reached")
@@ -1671,6 +1691,34 @@ class HarvestTab(QWidget):
             return set()
         return set()
 
+    @staticmethod
+    def _format_retry_detail(isbn, att, retry_delta):
+        """Return one ``isbn | last not found | retry after`` line for the retry dialog.
+
+        ``att.last_attempted`` may be the current ``yyyymmdd`` integer or a legacy
+        ISO-8601 string; anything unparseable is shown verbatim with an unknown
+        retry date.
+        """
+        last_attempted = att.last_attempted
+        try:
+            last_val = str(last_attempted) if last_attempted is not None else ""
+            if last_val.isdigit() and len(last_val) == 8:
+                # Current storage format: yyyymmdd integer stored as text.
+                last_dt = datetime(int(last_val[:4]), int(last_val[4:6]), int(last_val[6:8]), tzinfo=timezone.utc)
+            elif last_val:
+                # Legacy storage format: ISO-8601 datetime string.
+                last_dt = datetime.fromisoformat(last_val)
+                if last_dt.tzinfo is None:
+                    last_dt = last_dt.replace(tzinfo=timezone.utc)
+            else:
+                raise ValueError("empty")
+            last_str = last_dt.astimezone().strftime("%Y-%m-%d")
+            next_str = (last_dt + retry_delta).astimezone().strftime("%Y-%m-%d")
+        except Exception:
+            last_str = str(last_attempted) if last_attempted is not None else "Unknown"
+            next_str = "Unknown"
+        return f"{isbn} | last not found: {last_str} | retry after: {next_str}"
+
     def _is_retry_popup_candidate(self, error_text: str) -> bool:
         """Return ``True`` if *error_text* represents a "not found" outcome eligible for retry.
 
@@ -1706,14 +1754,27 @@ class HarvestTab(QWidget):
 
         Returns:
             Dict of advanced setting overrides, or ``{}`` if the file is absent or invalid.
+
+        The parsed result is cached against the file's ``(mtime_ns, size)`` so
+        repeated starts only pay for a single ``stat()`` when nothing changed.
         """
         settings_path = Path("data/advanced_settings.json")
-        if not settings_path.exists():
+        try:
+            st = settings_path.stat()
+        except OSError:
+            self._adv_cache = None
             return {}
+        key = (st.st_mtime_ns, st.st_size)
+        if self._adv_cache is not None and self._adv_cache[0] == key:
+            return dict(self._adv_cache[1])
         try:
-            return json.loads(settings_path.read_text(encoding="utf-8"))
+            data = json.loads(settings_path.read_text(encoding="utf-8"))
         except Exception:
-            return {}
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+        self._adv_cache = (key, data)
+        return dict(data)
 
     def _on_progress(self, isbn, status, source, msg):
         """Update the log label and re-emit the progress signal to the main window.
@@ -1748,7 +1809,15 @@ class HarvestTab(QWidget):
         )
         self.processed_count = processed
         self.total_count = total
-
+        # Not restarted while pending, so a steady stream still repaints every
+        # interval and the newest counts are always painted after the last tick.
+        if not self._stats_paint_timer.isActive():
+            self._stats_paint_timer.start()
+
+    def _flush_stats_paint(self):
+        """Paint the newest counts recorded by ``_on_stats``."""
+        processed = self.processed_count
+        total = self.total_count
         progress_str = f"{processed} / {total}"
         pct = int(processed / total * 100) if total > 0 else 0
         self.lbl_progress_text.setText(f"{progress_str}  ({pct}%)")
@@ -1788,6 +1857,8 @@ class HarvestTab(QWidget):
             self._last_session_failed = list(self.worker._session_failed)
             self._last_session_invalid = list(self.worker._session_invalid)
 
+        # Drop a pending progress paint so it cannot overwrite the final state.
+        self._stats_paint_timer.stop()
         error_msg = stats.get("error") if not success else None
         final_state = UIState.COMPLETED if success else UIState.CANCELLED
         self._transition_state(final_state, stats=stats)
@@ -1813,7 +1884,11 @@ class HarvestTab(QWidget):
             else:
                 self.log_output.setText("Ready...")
         else:
-            self.log_output.setText("Harvest complete. View results in Dashboard.")
+            completed = messages.HarvestMessages.harvest_completed.format(
+                successes=stats.get("found", 0),
+                failures=stats.get("failed", 0),
+            )
+            self.log_output.setText(f"{completed}. View results in Dashboard.")
 
             # Force progress bar to 100% on success
             self.progress_bar.setValue(100)
@@ -1952,20 +2027,19 @@ class HarvestTab(QWidget):
 
     def _resolve_marc_source_conflict(
         self,
-        db_path: str,
         source_name: str,
         parsed_records: list,
+        existing_rows: list,
     ) -> tuple[bool | None, list]:
         """Check for ISBN overlap between the new file and existing DB records.
 
-        Compares ISBNs inside the new file against ISBNs already stored under
-        *source_name* in the database.  Returns a ``(replace_existing, records)``
+        Compares ISBNs inside the new file against *existing_rows*, the
+        ``(isbn,)`` rows already stored under *source_name* (see
+        ``_fetch_source_isbns``).  Returns a ``(replace_existing, records)``
         tuple where *replace_existing* is ``None`` to abort, ``True`` to replace
         the existing source, or ``False`` to insert; and *records* is the
         (possibly filtered) list to persist.
         """
-        import sqlite3 as _sqlite3
-
         # Collect ISBNs from the new file's parsed records.
         new_isbns: set[str] = set()
         for r in parsed_records:
@@ -1977,16 +2051,9 @@ class HarvestTab(QWidget):
         if not new_isbns:
             return False, parsed_records
 
-        # Query existing ISBNs stored under this source name.
-        try:
-            conn = _sqlite3.connect(db_path)
-            rows = conn.execute(
-                "SELECT DISTINCT isbn FROM main WHERE source = ?", (source_name,)
-            ).fetchall()
-            conn.close()
-            existing_isbns: set[str] = {r[0].replace("-", "").strip() for r in rows if r[0]}
-        except Exception:
-            return False, parsed_records
+        existing_isbns: set[str] = {
+            r[0].replace("-", "").strip() for r in existing_rows if r[0]
+        }
 
         if not existing_isbns:
             return False, parsed_records
@@ -2138,7 +2205,7 @@ class HarvestTab(QWidget):
             save_source_to_active_profile=True,
         )
 
-        with open(out_path, "w", encoding="utf-8-sig", newline="") as fh:
+        with open(out_path, "w", encoding="utf-8-sig", newline="", buffering=_EXPORT_BUFFER_SIZE) as fh:
             writer = csv.writer(fh, delimiter="\t")
             writer.writerow(headers)
             for i, (isbn, lccn, nlmcn) in enumerate(selected_rows, 1):
@@ -2298,51 +2365,175 @@ class HarvestTab(QWidget):
                 pass
 
         source_file_hash = self._compute_file_hash(path)
+        self._set_marc_import_running(True)
+        self._marc_import_ctx = {
+            "path": path,
+            "source_name": source_name,
+            "mode": mode,
+            "headers": headers,
+            "selected_rows": selected_rows,
+            "parsed_records": parsed_records,
+            "date_added": date_added,
+            "total_records": total_records,
+            "written": written,
+            "skipped": skipped,
+            "no_isbn": no_isbn,
+            "out_path": out_path,
+            "live_dir": live_dir,
+            "db_path": db_path,
+            "profile_name": profile_name,
+            "source_file_hash": source_file_hash,
+        }
+        # The overlap check reads every ISBN already stored under this source,
+        # so it also runs on the pool; _on_marc_overlap_fetched continues.
+        job = _BackgroundJob(self._fetch_source_isbns, db_path, source_name)
+        job.signals.finished.connect(self._on_marc_overlap_fetched)
+        job.signals.failed.connect(self._on_marc_overlap_failed)
+        self._marc_job = job
+        QThreadPool.globalInstance().start(job)
+
+    @staticmethod
+    def _fetch_source_isbns(db_path: str, source_name: str) -> list:
+        """Return ``(isbn,)`` rows already stored in ``main`` under *source_name*."""
+        conn = sqlite3.connect(db_path)
+        try:
+            return conn.execute(
+                "SELECT DISTINCT isbn FROM main WHERE source = ?", (source_name,)
+            ).fetchall()
+        finally:
+            conn.close()
+
+    def _on_marc_overlap_failed(self, exc):
+        """Treat an unreadable database as having no overlapping ISBNs."""
+        logger.warning("MARC overlap check failed: %s", exc)
+        self._on_marc_overlap_fetched([])
+
+    def _on_marc_overlap_fetched(self, existing_rows):
+        """Resolve source conflicts, then start the database write on the pool."""
+        ctx = self._marc_import_ctx
+        # The duplicate-ISBN dialog waits on the user, so drop the busy cursor
+        # until the write job starts.
+        self._set_marc_wait_cursor(False)
         replace_existing_source, parsed_records = self._resolve_marc_source_conflict(
-            db_path, source_name, parsed_records
+            ctx["source_name"], ctx["parsed_records"], existing_rows
         )
         if replace_existing_source is None:
-            self._btn_import_marc.setEnabled(True)
+            self._marc_job = None
+            self._marc_import_ctx = None
+            self._set_marc_import_running(False)
             self._marc_hint_label.setText("Import cancelled.")
             return
 
         marc_service = MarcImportService(
-            db_path=db_path,
+            db_path=ctx["db_path"],
             profile_manager=ProfileManager(),
-            profile_name=profile_name,
+            profile_name=ctx["profile_name"],
         )
-        db_summary = marc_service.persist_records(
+        # Replacing a source deletes its rows before the bulk insert; on a large
+        # database that transaction can take seconds, so it runs on the pool and
+        # _on_marc_persist_finished picks the import up once it is committed.
+        self._marc_hint_label.setText("Step 2/3 - Saving records to the database...")
+        job = _BackgroundJob(
+            marc_service.persist_records,
             parsed_records,
-            source_name=source_name,
-            import_date=date_added,
+            source_name=ctx["source_name"],
+            import_date=ctx["date_added"],
             save_source_to_active_profile=True,
-            source_file_name=Path(path).name,
-            source_file_hash=source_file_hash,
+            source_file_name=Path(ctx["path"]).name,
+            source_file_hash=ctx["source_file_hash"],
             replace_existing_source=replace_existing_source,
         )
+        job.signals.finished.connect(self._on_marc_persist_finished)
+        job.signals.failed.connect(self._on_marc_persist_failed)
+        self._marc_job = job
+        self._set_marc_wait_cursor(True)
+        QThreadPool.globalInstance().start(job)
+
+    def _set_marc_import_running(self, running: bool):
+        """Lock or unlock the controls that must not re-enter a MARC import.
+
+        While running, the Run and Start Harvest buttons are disabled, the
+        cursor shows a wait state (cleared while the duplicate-ISBN dialog is
+        open), and ``marc_import_active`` tells the main
+        window to lock profile switching and closing.
+        """
+        if running == self.marc_import_running:
+            return
+        self.marc_import_running = running
+        self._btn_import_marc.setEnabled(not running)
+        self.btn_start.setEnabled(not running and self.current_state == UIState.READY)
+        self._set_marc_wait_cursor(running)
+        self.marc_import_active.emit(running)
+
+    def _set_marc_wait_cursor(self, waiting: bool):
+        """Show or clear the app-wide wait cursor, keeping set/restore balanced."""
+        if waiting == self._marc_wait_cursor:
+            return
+        self._marc_wait_cursor = waiting
+        if waiting:
+            QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        else:
+            QApplication.restoreOverrideCursor()
+
+    def _on_marc_persist_failed(self, exc):
+        """Report a failed MARC database write and unlock the UI."""
+        logger.error("MARC import failed while saving to the database: %s", exc)
+        self._marc_job = None
+        self._marc_import_ctx = None
+        self._set_marc_import_running(False)
+        self._marc_hint_label.setText(f"Import failed: {_friendly_error(exc)}")
+
+    def _on_marc_persist_finished(self, db_summary):
+        """Write the TSV export and show the summary once the database write is committed."""
+        ctx = self._marc_import_ctx
+        self._marc_job = None
+        self._marc_import_ctx = None
+        # The export below yields to the event loop, so stay locked until it is written.
+        try:
+            self._write_marc_import_export(ctx, db_summary)
+        finally:
+            self._set_marc_import_running(False)
+        self._show_marc_import_summary(ctx, db_summary)
+
+    def _write_marc_import_export(self, ctx, db_summary):
+        """Write the MARC import TSV export and update the MARC stat tiles."""
+        source_name = ctx["source_name"]
+        mode = ctx["mode"]
+        selected_rows = ctx["selected_rows"]
+        date_added = ctx["date_added"]
+        total_records = ctx["total_records"]
+        written = ctx["written"]
+        skipped = ctx["skipped"]
+        out_path = ctx["out_path"]
+
+        # Pick the row layout once instead of branching on mode for every record.
+        if mode == "nlmcn":
+            def build_row(isbn, lccn, nlmcn):
+                return (isbn or "", nlmcn, source_name, date_added)
+        elif mode == "both":
+            def build_row(isbn, lccn, nlmcn):
+                return (
+                    isbn or "",
+                    lccn or "", source_name if lccn else "",
+                    _extract_lc_classification(lccn or ""),
+                    nlmcn or "", source_name if nlmcn else "",
+                    date_added,
+                )
+        else:
+            def build_row(isbn, lccn, nlmcn):
+                return (isbn or "", lccn, source_name, _extract_lc_classification(lccn), date_added)
 
-        with open(out_path, "w", encoding="utf-8-sig", newline="") as fh:
+        with open(out_path, "w", encoding="utf-8-sig", newline="", buffering=_EXPORT_BUFFER_SIZE) as fh:
             writer = csv.writer(fh, delimiter="\t")
-            writer.writerow(headers)
-            for i, (isbn, lccn, nlmcn) in enumerate(selected_rows, 1):
-                if mode == "nlmcn":
-                    row = [isbn or "", nlmcn, source_name, date_added]
-                elif mode == "both":
-                    classification = _extract_lc_classification(lccn or "")
-                    row = [
-                        isbn or "",
-                        lccn or "", source_name if lccn else "",
-                        classification,
-                        nlmcn or "", source_name if nlmcn else "",
-                        date_added,
-                    ]
-                else:
-                    classification = _extract_lc_classification(lccn)
-                    row = [isbn or "", lccn, source_name, classification, date_added]
-                writer.writerow(row)
-                if i % 500 == 0:
+            writer.writerow(ctx["headers"])
+            # Write in 500-row batches via writerows, yielding to the event loop between them.
+            batch = 500
+            for start in range(0, len(selected_rows), batch):
+                writer.writerows(build_row(*rec) for rec in selected_rows[start:start + batch])
+                done = start + batch
+                if done <= len(selected_rows):
                     self._marc_hint_label.setText(
-                        f"Step 2/3 - Processed {i:,} / {total_records:,}..."
+                        f"Step 2/3 - Processed {done:,} / {total_records:,}..."
                     )
                     QApplication.processEvents()
 
@@ -2356,8 +2547,18 @@ class HarvestTab(QWidget):
         self._marc_stat_callnums.setText(f"{written:,}")
         self._marc_stat_matched.setText(f"{db_summary.main_rows:,}")
         self._marc_stat_unmatched.setText(f"{skipped + db_summary.skipped_records:,}")
-        self._btn_import_marc.setEnabled(True)
 
+    def _show_marc_import_summary(self, ctx, db_summary):
+        """Show the MARC import summary dialog with an Open Output Folder action."""
+        mode = ctx["mode"]
+        written = ctx["written"]
+        skipped = ctx["skipped"]
+        total_records = ctx["total_records"]
+        no_isbn = ctx["no_isbn"]
+        out_path = ctx["out_path"]
+        source_name = ctx["source_name"]
+        path = ctx["path"]
+        live_dir = ctx["live_dir"]
         mode_label = {"lccn": "LCCN Only", "nlmcn": "NLM Only", "both": "Both (LCCN & NLM)"}.get(mode, mode)
         summary_lines = [
             "<b>MARC Import Complete</b>",
@@ -17,6 +17,8 @@ Usage example::
     btn.setIcon(get_icon(SVG_DASHBOARD, color="#cdd6f4"))
 """
 
+from functools import lru_cache
+
 from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor
 from PyQt6.QtCore import QByteArray, Qt
 from PyQt6.QtSvg import QSvgRenderer
@@ -87,6 +89,7 @@ SVG_X_CIRCLE = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fi
 
 # --- Helpers ---
 
+@lru_cache(maxsize=128)
 def get_icon(svg_data: str, color: str = "#a5adcb") -> QIcon:
     """Rasterize an SVG string into a 24×24 ``QIcon`` with the given tint color.
 
@@ -95,6 +98,11 @@ def get_icon(svg_data: str, color: str = "#a5adcb") -> QIcon:
     this module use ``stroke="currentColor"`` precisely so they can be recolored
     at runtime.
 
+    Results are memoized per ``(svg_data, color)``: the sidebar chevron and
+    theme toggle re-request the same few icons on every collapse and theme
+    change, and ``QIcon`` is implicitly shared so handing out one instance to
+    several widgets is safe.
+
     Args:
         svg_data: SVG markup string (typically one of the ``SVG_*`` constants).
         color: CSS hex color string used as the stroke/fill tint.
@@ -117,6 +125,8 @@ def get_icon(svg_data: str, color: str = "#a5adcb") -> QIcon:
 
     return QIcon(pixmap)
 
+
+@lru_cache(maxsize=128)
 def get_pixmap(svg_data: str, color: str = "#a5adcb", size: int = 24) -> QPixmap:
     """Rasterize an SVG string into a square ``QPixmap`` with the given tint color.
 
@@ -124,6 +134,9 @@ def get_pixmap(svg_data: str, color: str = "#a5adcb", size: int = 24) -> QPixmap
     directly and accepts a configurable *size* so callers can produce icons at
     sizes other than 24 px (e.g. 15 px badge icons in the Help tab).
 
+    Memoized like :func:`get_icon`; ``QPixmap`` is implicitly shared, and
+    callers only hand the result to ``QLabel.setPixmap``.
+
     Args:
         svg_data: SVG markup string.
         color: CSS hex color string used as the stroke/fill tint.
@@ -14,6 +14,9 @@ Module-level constants:
         rather than fully scanned to keep the UI responsive.
     INFO_SAMPLE_MAX_LINES (int): Number of lines examined for the stats summary
         when a file exceeds ``LARGE_FILE_THRESHOLD_BYTES`` (200 000).
+    ON_DEMAND_STATS_THRESHOLD_BYTES (int): Files above this size (200 MB) get
+        only a preview on selection; the stats scan runs when the user clicks
+        "Compute statistics…".
 
 Note: ``ClickableDropZone`` is also imported directly by ``harvest_tab.py`` as
 a drop target for the run-setup card.
@@ -21,17 +24,244 @@ a drop target for the run-setup card.
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QLineEdit, QFileDialog, QGroupBox,
-    QTextEdit, QFrame, QSizePolicy, QScrollArea
+    QTextEdit, QFrame, QSizePolicy, QScrollArea, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QEvent
+from PyQt6.QtCore import Qt, pyqtSignal, QEvent, QObject, QThreadPool, QTimer
 from PyQt6.QtGui import QDragEnterEvent, QDropEvent, QMouseEvent
+import codecs
+import html
+import mmap
+import re
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
-from itertools import islice
 from src.utils.isbn_validator import normalize_isbn
 
 PREVIEW_MAX_LINES = 20
 LARGE_FILE_THRESHOLD_BYTES = 20 * 1024 * 1024  # 20 MB
 INFO_SAMPLE_MAX_LINES = 200_000
+ON_DEMAND_STATS_THRESHOLD_BYTES = 200 * 1024 * 1024  # 200 MB
+# First-row tokens recognised as an ISBN column header rather than data.
+_HEADER_TOKENS = frozenset({"isbn", "isbns", "isbn13", "isbn10"})
+
+
+# Link target in the on-demand info text (see ``_read_preview_only``).
+_COMPUTE_STATS_HREF = "compute-stats"
+# How often (in lines) the background scan checks whether it was superseded.
+_INFO_CANCEL_CHECK_LINES = 4096
+# Upper bound on bytes decoded for the preview, whatever the line lengths.
+_PREVIEW_MAX_BYTES = 64 * 1024
+
+# One match per line: group 1 is the first tab-separated column with the
+# surrounding whitespace already trimmed (runs of inner spaces are kept), or
+# empty for blank and "#" comment lines.  The rest of the line and its
+# terminator are consumed, so the result has exactly one entry per line.
+_FIRST_COLUMN_RE = re.compile(
+    rb"[ \t\f\v]*"
+    rb"(?:#[^\r\n]*|([^\s#][^\t\r\n \f\v]*(?:[ \f\v]+[^\t\r\n \f\v]+)*)?[^\r\n]*)"
+    rb"(?:\r\n?|\n|$)"
+)
+_READ_CHUNK_BYTES = 1 << 20
+# Cheap necessary condition for a valid ISBN under both the stdnum and the
+# fallback normaliser: at least nine ISBN characters (an SBN has nine).  Tokens
+# failing it are counted invalid without the slower normalize_isbn call.
+_ISBN_CANDIDATE_RE = re.compile(rb"(?:[^0-9Xx]*[0-9Xx]){9}")
+
+
+@lru_cache(maxsize=131072)
+def _normalize_token(token):
+    """Return ``normalize_isbn`` of a raw first-column ``bytes`` token.
+
+    Memoised across scans: re-selecting an edited file, or a sibling export
+    from the same catalogue, mostly repeats tokens already normalised.  The
+    bound keeps the cache to a few megabytes.
+    """
+    return normalize_isbn(token.decode("utf-8"))
+
+
+def _preview_from_buffer(data, start):
+    """Return the first ``PREVIEW_MAX_LINES`` lines of *data* as preview text.
+
+    Args:
+        data: ``bytes`` or ``mmap`` holding the start of the file.
+        start: Offset of the first content byte (past any BOM).
+
+    Returns:
+        Decoded preview text, with a truncation notice when more data follows.
+    """
+    limit = min(len(data), start + _PREVIEW_MAX_BYTES)
+    end = start
+    for _ in range(PREVIEW_MAX_LINES):
+        newline = data.find(b"\n", end, limit)
+        if newline < 0:
+            end = limit
+            break
+        end = newline + 1
+    preview_text = data[start:end].decode("utf-8", errors="replace").replace("\r\n", "\n")
+    if end < len(data):
+        preview_text += "\n... (truncated)"
+    return preview_text
+
+
+def _read_preview_and_tokens(path, sampled):
+    """Read *path* once and return its preview text and first-column tokens.
+
+    Files within the sampling threshold are memory-mapped and split by a single
+    regex ``findall`` over the mapping, so the bytes are never copied into a
+    Python buffer and the per-line work happens in C.  When *sampled*, just
+    enough 1 MiB chunks to cover ``INFO_SAMPLE_MAX_LINES`` lines are read
+    instead, keeping the mapping (and address-space use) bounded.  The
+    preview is cut from the same buffer, so the file is opened only once.
+
+    Args:
+        path: ``Path`` of the file to read.
+        sampled: Limit the tokens to the first ``INFO_SAMPLE_MAX_LINES`` lines.
+
+    Returns:
+        ``(preview_text, tokens)`` where *tokens* holds the trimmed
+        first-column ``bytes`` of each line (``b""`` for blank and comment
+        lines).
+    """
+    with open(path, "rb") as f:
+        if not sampled:
+            try:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped.
+                return "", []
+        else:
+            chunks = []
+            newlines = 0
+            while newlines < INFO_SAMPLE_MAX_LINES:
+                chunk = f.read(_READ_CHUNK_BYTES)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                newlines += chunk.count(b"\n")
+            data = b"".join(chunks)
+        try:
+            # Skip a UTF-8 BOM by offset rather than slicing a copy.
+            start = len(codecs.BOM_UTF8) if data[:3] == codecs.BOM_UTF8 else 0
+            preview_text = _preview_from_buffer(data, start)
+            tokens = _FIRST_COLUMN_RE.findall(data, start)
+        finally:
+            if not sampled:
+                data.close()
+    if sampled:
+        del tokens[INFO_SAMPLE_MAX_LINES:]
+    return preview_text, tokens
+
+
+def _read_preview_only(path, file_size):
+    """Return ``(preview_text, info_html)`` for a file whose stats are on demand.
+
+    Reads just enough bytes for the preview; the info text carries the
+    ``"Compute statistics…"`` link handled by ``InputTab._on_info_link``.
+    """
+    with open(path, "rb") as f:
+        # A few bytes past the preview cap so the truncation notice is shown.
+        data = f.read(len(codecs.BOM_UTF8) + _PREVIEW_MAX_BYTES + 1)
+    start = len(codecs.BOM_UTF8) if data[:3] == codecs.BOM_UTF8 else 0
+    info_html = (
+        f"File: {html.escape(path.name)}<br>"
+        f"Size: {file_size / 1024:.2f} KB<br>"
+        f'<a href="{_COMPUTE_STATS_HREF}">Compute statistics…</a>'
+    )
+    return _preview_from_buffer(data, start), info_html
+
+
+def _scan_file(path, file_size, should_stop=None, with_stats=True):
+    """Read *path* in one pass and return its preview and File Information text.
+
+    Runs off the GUI thread (see ``InputTab._update_file_info``), so it touches
+    no widgets.  For very large files (> ``LARGE_FILE_THRESHOLD_BYTES``) only
+    the first ``INFO_SAMPLE_MAX_LINES`` lines are sampled and a note is
+    appended.  Skips blank lines, comment lines starting with ``#``, and the
+    first header row if it matches a known ISBN column-header token.
+
+    Args:
+        path: ``Path`` of the file to scan.
+        file_size: Size in bytes from the caller's ``stat()``.
+        should_stop: Optional zero-argument callable polled every
+            ``_INFO_CANCEL_CHECK_LINES`` lines; returning ``True`` aborts.
+        with_stats: ``False`` reads only the preview and returns a
+            "Compute statistics…" link in place of the summary.
+
+    Returns:
+        ``(preview_text, info_text)``; both are an ``"Error reading file: ..."``
+        message on failure.  ``None`` when the scan was cancelled.
+    """
+    try:
+        if not with_stats:
+            return _read_preview_only(path, file_size)
+        # Sample large files so the scan finishes in bounded time.
+        sampled = file_size > LARGE_FILE_THRESHOLD_BYTES
+        preview_text, tokens = _read_preview_and_tokens(path, sampled)
+        # Blank lines and "#" comment lines come back empty from the regex.
+        rows = list(filter(None, tokens))
+        del tokens
+        # Skip a recognised header token on the very first data row.
+        if rows and rows[0].decode("utf-8").lower() in _HEADER_TOKENS:
+            del rows[0]
+
+        # Union-catalogue dumps repeat ISBNs heavily, so count identical raw
+        # tokens in C first and run normalize_isbn once per distinct token.
+        # The row list is dropped straight away so only the distinct tokens
+        # and normalised ISBNs are alive during the loop.
+        token_counts = Counter(rows)
+        del rows
+        valid_rows = 0
+        invalid_rows = 0
+        seen: set[str] = set()
+        for i, (token, count) in enumerate(token_counts.items(), start=1):
+            if should_stop is not None and i % _INFO_CANCEL_CHECK_LINES == 0 and should_stop():
+                return None
+            if not _ISBN_CANDIDATE_RE.match(token):
+                invalid_rows += count
+                continue
+            normalized = _normalize_token(token)
+            if not normalized:
+                invalid_rows += count
+                continue
+            valid_rows += count
+            seen.add(normalized)
+        unique_valid = len(seen)
+
+        duplicate_valid_rows = max(0, valid_rows - unique_valid)
+        sample_note = ""
+        if sampled:
+            sample_note = (
+                f"\nNote: Large file detected. Statistics are based on the first "
+                f"{INFO_SAMPLE_MAX_LINES:,} lines."
+            )
+
+        info_text = (
+            f"File: {path.name}\n"
+            f"Size: {file_size / 1024:.2f} KB\n"
+            f"Valid ISBNs (unique): {unique_valid}\n"
+            f"Valid ISBN rows: {valid_rows}\n"
+            f"Duplicate valid rows: {duplicate_valid_rows}\n"
+            f"Invalid ISBN rows: {invalid_rows}"
+            f"{sample_note}"
+        )
+        return preview_text, info_text
+    except Exception as e:
+        error_text = f"Error reading file: {str(e)}"
+        return error_text, error_text
+
+
+class _FileInfoSignals(QObject):
+    """Signal carrier for the background file scan.
+
+    Lives on the GUI thread, so emitting from a pool thread is delivered as a
+    queued call on the event loop.
+
+    Signals:
+        scan_ready(int, str, str): Scan generation, preview text, and the
+            formatted summary text.
+    """
+
+    scan_ready = pyqtSignal(int, str, str)
 
 
 class ClickableDropZone(QFrame):
@@ -63,6 +293,12 @@ class ClickableDropZone(QFrame):
         self.setProperty("class", "DragZone")
         # Initial state drives the QSS DragZone[state="ready"] selector.
         self.setProperty("state", "ready")
+        # One restartable timer ends the "success" flash; back-to-back drops
+        # extend it instead of stacking resets that fire mid-flash.
+        self._reset_timer = QTimer(self)
+        self._reset_timer.setSingleShot(True)
+        self._reset_timer.setInterval(500)
+        self._reset_timer.timeout.connect(lambda: self._update_state("ready"))
 
     def mousePressEvent(self, event: QMouseEvent):
         """Emit ``clicked`` on left mouse-button press so the zone acts as a button."""
@@ -80,6 +316,8 @@ class ClickableDropZone(QFrame):
                 file_path = url.toLocalFile()
                 if file_path:
                     event.acceptProposedAction()
+                    # A pending flash reset must not clear the hover state.
+                    self._reset_timer.stop()
                     self._update_state("active")
                     return
         event.ignore()
@@ -104,12 +342,10 @@ class ClickableDropZone(QFrame):
             self._update_state("success")
 
             # Reset to "ready" after 500 ms so the zone is reusable immediately.
-            from PyQt6.QtCore import QTimer
-            QTimer.singleShot(500, lambda: self._update_state("ready"))
+            self._reset_timer.start()
 
             event.acceptProposedAction()
         else:
-            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.warning(
                 self,
                 "Invalid File",
@@ -125,6 +361,10 @@ class ClickableDropZone(QFrame):
             state: One of ``"ready"``, ``"active"`` (drag hover), or ``"success"``
                    (brief flash after a successful drop).
         """
+        # Drag-enter can fire repeatedly during a hover; re-polishing with an
+        # unchanged state is pure stylesheet work, so skip it.
+        if self.property("state") == state:
+            return
         self.setProperty("state", state)
         # unpolish/polish forces Qt to re-evaluate DragZone[state="..."] rules.
         self.style().unpolish(self)
@@ -145,6 +385,8 @@ class InputTab(QWidget):
             or ``None`` when no file is selected.
         advanced_mode (bool): Placeholder for future advanced-mode UI extensions;
             has no effect in the current implementation.
+        _info_generation (int): Bumped per file scan; stale scan results
+            carrying an older value are dropped by ``_apply_scan_result``.
 
     Signals:
         file_selected(str): Emitted with the absolute file path whenever a file
@@ -154,9 +396,24 @@ class InputTab(QWidget):
     # Emitted with the absolute path whenever a file is successfully loaded.
     file_selected = pyqtSignal(str)
 
+    # Maximum number of files whose preview / info text is kept in _scan_cache.
+    _FILE_CACHE_SIZE = 8
+
     def __init__(self):
         super().__init__()
         self.input_file = None
+        # File-info scans run on a private single-thread pool; the generation
+        # counter lets a new selection supersede a scan still in flight.
+        self._info_pool = QThreadPool(self)
+        self._info_pool.setMaxThreadCount(1)
+        self._info_generation = 0
+        self._info_signals = _FileInfoSignals(self)
+        self._info_signals.scan_ready.connect(self._apply_scan_result)
+        # (path, st_mtime_ns, st_size) -> (preview_text, info_text); insertion
+        # order doubles as LRU order, so toggling between recent files skips
+        # the re-read.
+        self._scan_cache = {}
+        self._scan_key = None
         self._setup_ui()
 
     def _setup_ui(self):
@@ -257,7 +514,11 @@ class InputTab(QWidget):
 
         self.info_label = QLabel("No file selected")
         self.info_label.setWordWrap(True)
-        self.info_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self.info_label.setTextInteractionFlags(
+            Qt.TextInteractionFlag.TextSelectableByMouse
+            | Qt.TextInteractionFlag.LinksAccessibleByMouse
+        )
+        self.info_label.linkActivated.connect(self._on_info_link)
         info_layout.addWidget(self.info_label)
 
         info_group.setLayout(info_layout)
@@ -308,106 +569,91 @@ class InputTab(QWidget):
         """
         self.input_file = Path(file_path)
         self.file_path_edit.setText(str(self.input_file))
-        self._load_file_preview()
-        self._update_file_info()
+        # One stat() serves as the existence check and as the scan-cache key.
+        try:
+            st = self.input_file.stat()
+        except OSError as e:
+            self._info_generation += 1
+            self.preview_text.setPlainText(f"Error reading file: {str(e)}")
+            self.info_label.setText(f"Error reading file: {str(e)}")
+        else:
+            self._update_file_info((str(self.input_file), st.st_mtime_ns, st.st_size))
         self.file_selected.emit(str(self.input_file))
 
-    def _load_file_preview(self):
-        """Read up to ``PREVIEW_MAX_LINES`` lines and populate the preview text widget."""
-        if not self.input_file or not self.input_file.exists():
-            return
+    @classmethod
+    def _cache_put(cls, cache, key, value):
+        """Insert *value* as the most recently used entry, evicting the oldest."""
+        cache.pop(key, None)
+        if len(cache) >= cls._FILE_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        cache[key] = value
+
+    def _update_file_info(self, cache_key, force_stats=False):
+        """Start a background scan that fills both the preview and the File Information panel.
+
+        The scan itself (``_scan_file``) reads the file once on ``_info_pool`` so
+        large or network-mounted files never block the event loop; the preview
+        and summary text come back together through ``_info_signals.scan_ready``
+        to ``_apply_scan_result``.  Each call bumps ``_info_generation``; an
+        older scan still in flight sees the change, stops early, and its result
+        (if any) is discarded.  A file version already in ``_scan_cache`` is
+        shown without scanning.  Files above ``ON_DEMAND_STATS_THRESHOLD_BYTES``
+        only get a preview until the user asks for statistics.
 
-        try:
-            with open(self.input_file, 'r', encoding='utf-8-sig') as f:
-                lines = list(islice(f, PREVIEW_MAX_LINES))
-                preview_text = ''.join(lines)
-                if len(lines) == PREVIEW_MAX_LINES:
-                    preview_text += "\n... (truncated)"
-                self.preview_text.setPlainText(preview_text)
-        except Exception as e:
-            self.preview_text.setPlainText(f"Error reading file: {str(e)}")
+        Args:
+            cache_key: ``(path, st_mtime_ns, st_size)`` from ``_load_file``.
+            force_stats: Run the full stats scan regardless of file size
+                (the "Compute statistics…" link).
+        """
+        self._info_generation += 1
+        self._scan_key = cache_key
+        if not force_stats:
+            cached = self._scan_cache.get(cache_key)
+            if cached is not None:
+                self._cache_put(self._scan_cache, cache_key, cached)
+                self._show_scan_result(*cached)
+                return
+
+        generation = self._info_generation
+        path = self.input_file
+        file_size = cache_key[2]
+        with_stats = force_stats or file_size <= ON_DEMAND_STATS_THRESHOLD_BYTES
+        if not force_stats:
+            self.preview_text.clear()
+        self.info_label.setText(f"File: {path.name}\nScanning…")
+
+        def job():
+            result = _scan_file(
+                path, file_size, lambda: generation != self._info_generation, with_stats
+            )
+            if result is not None:
+                self._info_signals.scan_ready.emit(generation, *result)
+
+        self._info_pool.start(job)
 
-    def _update_file_info(self):
-        """Scan the input file and populate the File Information summary panel.
+    def _apply_scan_result(self, generation, preview_text, info_text):
+        """Slot for ``scan_ready``: show the result unless a newer scan superseded it.
 
-        For very large files (> ``LARGE_FILE_THRESHOLD_BYTES``) only the first
-        ``INFO_SAMPLE_MAX_LINES`` lines are sampled and a note is appended.
-        Skips blank lines, comment lines starting with ``#``, and the first
-        header row if it matches a known ISBN column-header token.
+        Args:
+            generation: ``_info_generation`` value the scan was started with.
+            preview_text: Text for the preview widget (or an error message).
+            info_text: Formatted summary (or error message) for ``info_label``.
         """
-        if not self.input_file or not self.input_file.exists():
+        if generation != self._info_generation:
             return
-
-        try:
-            total_nonempty = 0
-            candidate_rows = 0
-            valid_rows = 0
-            invalid_rows = 0
-            seen: set[str] = set()
-            unique_valid = 0
-            file_size = self.input_file.stat().st_size
-            # Sample large files to avoid blocking the UI for many seconds.
-            sampled = file_size > LARGE_FILE_THRESHOLD_BYTES
-
-            with open(self.input_file, 'r', encoding='utf-8-sig') as f:
-                first_data_row_seen = False
-                for i, line in enumerate(f, start=1):
-                    raw_line = line.strip()
-                    if not raw_line:
-                        continue
-                    total_nonempty += 1
-
-                    # First column only; tabs separate additional columns.
-                    raw_isbn = raw_line.split("\t")[0].strip()
-                    if not raw_isbn:
-                        continue
-
-                    # Lines starting with "#" are treated as comments.
-                    if raw_isbn.startswith("#"):
-                        continue
-
-                    # Skip a recognised header token on the very first data row.
-                    if not first_data_row_seen and raw_isbn.lower() in {"isbn", "isbns", "isbn13", "isbn10"}:
-                        first_data_row_seen = True
-                        continue
-
-                    first_data_row_seen = True
-                    candidate_rows += 1
-
-                    normalized = normalize_isbn(raw_isbn)
-                    if not normalized:
-                        invalid_rows += 1
-                        continue
-
-                    valid_rows += 1
-                    # Track seen ISBNs to compute the unique count.
-                    if normalized not in seen:
-                        seen.add(normalized)
-                        unique_valid += 1
-
-                    if sampled and i >= INFO_SAMPLE_MAX_LINES:
-                        break
-
-            duplicate_valid_rows = max(0, valid_rows - unique_valid)
-            sample_note = ""
-            if sampled:
-                sample_note = (
-                    f"\nNote: Large file detected. Statistics are based on the first "
-                    f"{INFO_SAMPLE_MAX_LINES:,} lines."
-                )
-
-            info_text = (
-                f"File: {self.input_file.name}\n"
-                f"Size: {self.input_file.stat().st_size / 1024:.2f} KB\n"
-                f"Valid ISBNs (unique): {unique_valid}\n"
-                f"Valid ISBN rows: {valid_rows}\n"
-                f"Duplicate valid rows: {duplicate_valid_rows}\n"
-                f"Invalid ISBN rows: {invalid_rows}"
-                f"{sample_note}"
-            )
-            self.info_label.setText(info_text)
-        except Exception as e:
-            self.info_label.setText(f"Error reading file: {str(e)}")
+        self._show_scan_result(preview_text, info_text)
+        if not info_text.startswith("Error reading file:"):
+            self._cache_put(self._scan_cache, self._scan_key, (preview_text, info_text))
+
+    def _on_info_link(self, href):
+        """Run the deferred stats scan when "Compute statistics…" is clicked."""
+        if href == _COMPUTE_STATS_HREF and self._scan_key is not None:
+            self._update_file_info(self._scan_key, force_stats=True)
+
+    def _show_scan_result(self, preview_text, info_text):
+        """Populate the preview widget and the File Information label."""
+        self.preview_text.setPlainText(preview_text)
+        self.info_label.setText(info_text)
 
     def get_input_file(self):
         """Return the absolute path of the selected input file as a string, or ``None``."""
@@ -16,25 +16,26 @@ Key responsibilities:
 """
 import logging
 import sys
+from datetime import datetime
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout,
-    QStackedWidget, QFrame, QStatusBar, QMessageBox, QButtonGroup, QScrollArea
+    QStackedWidget, QFrame, QMessageBox, QButtonGroup, QApplication,
 )
-from PyQt6.QtGui import QIcon, QAction, QKeySequence, QPixmap, QShortcut
-from PyQt6.QtCore import Qt, QSize, pyqtSignal, QPropertyAnimation, QEasingCurve, QParallelAnimationGroup
+from PyQt6.QtGui import QKeySequence, QShortcut
+from PyQt6.QtCore import Qt, QEvent, QSize, QTimer, QVariantAnimation, QEasingCurve
 
 # Import Tabs
 from .targets_config_tab import TargetsConfigTab
 from .harvest_tab import HarvestTab
 from .dashboard import DashboardTab
-from .help_tab import HelpTab
+# HelpTab is imported in _build_help_tab: the Help page is built on first visit.
 
 # Dialogs & Utils
 from .notifications import NotificationManager
-from .styles import DEFAULT_STYLESHEET, generate_stylesheet, CATPPUCCIN_DARK, CATPPUCCIN_LIGHT
+from .styles import DEFAULT_STYLESHEET, stylesheet_for_theme, CATPPUCCIN_DARK, CATPPUCCIN_LIGHT
 from .icons import (
-    get_icon, get_pixmap, 
+    get_icon,
     SVG_DASHBOARD, SVG_TARGETS, SVG_SETTINGS, SVG_RESULTS,
     SVG_HARVEST, SVG_CHEVRON_LEFT, SVG_CHEVRON_RIGHT,
     SVG_TOGGLE_ON, SVG_TOGGLE_OFF
@@ -86,12 +87,19 @@ class ModernMainWindow(QMainWindow):
 
         # Data
         self.advanced_mode = False
+        # Mode last pushed to the tabs; lets _apply_advanced_mode skip no-op calls.
+        self._applied_advanced_mode = None
         self.sidebar_collapsed = False
         self._sidebar_auto_collapsed = False
+        # Width animation for the sidebar, created on the first animated toggle.
+        self._sidebar_anim = None
         # In Qt/macOS key sequences: Ctrl maps to Command, Meta maps to physical Control.
         # Use Meta on macOS so shortcuts are truly Control+... as requested.
         self._shortcut_modifier = "Meta" if sys.platform == "darwin" else "Ctrl"
         self._profile_manager = ProfileManager()
+        # Set while a MARC import writes to the active profile; see
+        # _on_marc_import_active.
+        self._marc_import_active = False
         self._theme_manager = ThemeManager()
         try:
             self._profile_manager.set_active_profile("Default Settings")
@@ -100,7 +108,10 @@ class ModernMainWindow(QMainWindow):
         
         # Core Services
         self.notification_manager = NotificationManager(self)
-        self.notification_manager.setup_system_tray()
+        # Probing for a tray can block on DBus on some Linux desktops; run it
+        # from the event loop so the window paints first.  Notifications fall
+        # back to native mechanisms until the tray icon exists.
+        QTimer.singleShot(0, self.notification_manager.setup_system_tray)
 
         self._setup_layout()
         self._apply_advanced_mode()
@@ -143,7 +154,7 @@ class ModernMainWindow(QMainWindow):
         self.toggle_btn.setIcon(get_icon(SVG_CHEVRON_LEFT, "#8aadf4"))
         self.toggle_btn.setFixedSize(30, 30)
         self.toggle_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.toggle_btn.setStyleSheet("background: transparent; border: none;")
+        self.toggle_btn.setObjectName("SidebarToggle")
         self.toggle_btn.clicked.connect(self._toggle_sidebar)
         
         header_layout.addWidget(self.title_label)
@@ -156,6 +167,8 @@ class ModernMainWindow(QMainWindow):
         self.nav_group = QButtonGroup(self)
         self.nav_group.setExclusive(True)
         self.nav_group.buttonClicked.connect(self._on_nav_clicked)
+        # (button, label) pairs filled by _create_nav_btn for collapse/expand.
+        self._nav_button_texts = []
 
         # Navigation Buttons — order matches the stacked-widget page indices below.
         # Dashboard(0) → Configure(1) → Harvest(2) → Help(3)
@@ -215,13 +228,30 @@ class ModernMainWindow(QMainWindow):
         self.targets_tab = self.targets_config_tab.targets_tab
         self.config_tab = self.targets_config_tab.config_tab
         self.harvest_tab = HarvestTab()
-        self.help_tab = HelpTab(shortcut_modifier=self._shortcut_modifier)
+        # Pages that nothing else wires into are built on first visit; an empty
+        # placeholder holds their stack slot until ``_materialize_page`` runs.
+        # Dashboard, Configure and Harvest stay eager because the harvest
+        # signal flow and the shortcuts reference them from the start.
+        self._lazy_pages = {}
+        self._help_tab = None
 
         # Page indices must stay in sync with the nav-button indices above.
         self.stack.addWidget(self.dashboard_tab)         # 0 – Dashboard
         self.stack.addWidget(self.targets_config_tab)    # 1 – Configure
         self.stack.addWidget(self.harvest_tab)           # 2 – Harvest
-        self.stack.addWidget(self.help_tab)              # 3 – Help
+        self._help_index = self._add_lazy_page(self._build_help_tab)  # 3 – Help
+
+        # Eagerly built pages by name; lazy pages are reached via their properties.
+        self._tabs = {
+            "dashboard": self.dashboard_tab,
+            "configure": self.targets_config_tab,
+            "harvest": self.harvest_tab,
+        }
+        # Pages that react to advanced mode, resolved once for _apply_advanced_mode.
+        self._mode_aware_tabs = [
+            tab for tab in self._tabs.values()
+            if callable(getattr(tab, "set_advanced_mode", None))
+        ]
 
         content_layout.addWidget(self.stack)
 
@@ -240,7 +270,9 @@ class ModernMainWindow(QMainWindow):
 
         self._connect_signals()
         self._setup_accessibility()
-        self._setup_shortcuts()
+        # No key can reach the window before the event loop runs, so the
+        # shortcuts are registered from it rather than ahead of the first paint.
+        QTimer.singleShot(0, self._setup_shortcuts)
         self._refresh_dashboard_profile_controls()
         self._refresh_targets_profile_controls()
         self._sync_tab_state()
@@ -250,6 +282,48 @@ class ModernMainWindow(QMainWindow):
         self.stack.setCurrentIndex(1)
         self.page_title.setText("Configure")
 
+    def _add_lazy_page(self, factory):
+        """Reserve a stack slot for a page that is built on first visit.
+
+        Args:
+            factory: Zero-argument callable returning the real page widget.
+
+        Returns:
+            The stack index of the placeholder.
+        """
+        index = self.stack.addWidget(QWidget())
+        self._lazy_pages[index] = factory
+        return index
+
+    def _materialize_page(self, index):
+        """Build a deferred page and swap it in for its placeholder.
+
+        Pages that are already built (or were never deferred) are returned as-is.
+        """
+        factory = self._lazy_pages.pop(index, None)
+        if factory is None:
+            return self.stack.widget(index)
+        placeholder = self.stack.widget(index)
+        page = factory()
+        self.stack.insertWidget(index, page)
+        self.stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        return page
+
+    def _build_help_tab(self):
+        """Factory for the Help page (see ``_add_lazy_page``)."""
+        from .help_tab import HelpTab
+        self._help_tab = HelpTab(shortcut_modifier=self._shortcut_modifier)
+        self._help_tab.page_title_changed.connect(self.page_title.setText)
+        return self._help_tab
+
+    @property
+    def help_tab(self):
+        """The Help page, constructed and swapped into the stack on first access."""
+        if self._help_tab is None:
+            self._materialize_page(self._help_index)
+        return self._help_tab
+
     def _create_nav_btn(self, text, svg_icon, index):
         """Create a checkable sidebar navigation button and register it with the button group.
 
@@ -272,6 +346,11 @@ class ModernMainWindow(QMainWindow):
         btn.setProperty("page_index", index)
         # Store original text for expanding/collapsing
         btn.setProperty("full_text", text)
+        # Plain-attribute mirrors of the properties above; reading these avoids
+        # a QVariant round-trip on every navigation click.
+        btn._page_index = index
+        btn._full_text = text
+        self._nav_button_texts.append((btn, text))
         self.nav_group.addButton(btn)
         return btn
 
@@ -282,7 +361,7 @@ class ModernMainWindow(QMainWindow):
         self.toggle_btn.setAccessibleDescription("Collapse or expand left navigation sidebar.")
 
         for btn in self.nav_group.buttons():
-            label = btn.property("full_text") or btn.text().strip()
+            label = btn._full_text or btn.text().strip()
             btn.setAccessibleName(f"Open {label} page")
             btn.setToolTip(f"Open {label}")
 
@@ -296,43 +375,42 @@ class ModernMainWindow(QMainWindow):
         that shortcuts bind to the physical Control key on every platform.
         """
         mod = self._shortcut_modifier
-        self._shortcuts = []
+        # (sequence, slot) pairs; "{mod}" is replaced by the platform modifier.
+        # Slots are bound methods rather than lambdas so each activation goes
+        # straight to the target without an extra Python frame.
+        shortcut_table = (
+            ("{mod}+B", self._toggle_sidebar),
+            ("{mod}+Q", self.close),
+            # Numeric shortcuts match visible sidebar order: 1=Configure, 2=Harvest, 3=Dashboard, 4=Help
+            ("{mod}+1", self.btn_configure.click),
+            ("{mod}+2", self.btn_harvest.click),
+            ("{mod}+3", self.btn_dashboard.click),
+            ("{mod}+4", self.btn_help.click),
+            ("{mod}+Shift+D", self.btn_dashboard.click),
+            ("{mod}+Shift+H", self.btn_harvest.click),
+            ("{mod}+H", self._shortcut_start_harvest),
+            ("Esc", self._shortcut_stop_harvest),
+            ("{mod}+.", self._shortcut_stop_harvest),
+            ("{mod}+R", self._shortcut_refresh_dashboard),
+        )
 
-        def add_shortcut(sequence: str, callback):
-            """Create a single application-scoped shortcut and keep a reference."""
-            sc = QShortcut(QKeySequence(sequence), self)
+        self._shortcuts = []
+        for sequence, slot in shortcut_table:
+            sc = QShortcut(QKeySequence(sequence.format(mod=mod)), self)
             # ApplicationShortcut means the shortcut fires regardless of which widget has focus
             sc.setContext(Qt.ShortcutContext.ApplicationShortcut)
-            sc.activated.connect(callback)
+            sc.activated.connect(slot)
             self._shortcuts.append(sc)
 
-        def add_mod_shortcut(key: str, callback):
-            """Convenience wrapper that prepends the platform modifier."""
-            add_shortcut(f"{mod}+{key}", callback)
-
-        add_mod_shortcut("B", self._toggle_sidebar)
-        add_mod_shortcut("Q", self.close)
-        # Numeric shortcuts match visible sidebar order: 1=Configure, 2=Harvest, 3=Dashboard, 4=Help
-        add_mod_shortcut("1", lambda: self.btn_configure.click())
-        add_mod_shortcut("2", lambda: self.btn_harvest.click())
-        add_mod_shortcut("3", lambda: self.btn_dashboard.click())
-        add_mod_shortcut("4", lambda: self.btn_help.click())
-
-        add_mod_shortcut("Shift+D", lambda: self.btn_dashboard.click())
-        add_mod_shortcut("Shift+H", lambda: self.btn_harvest.click())
-
-        add_mod_shortcut("H", self._shortcut_start_harvest)
-        add_shortcut("Esc", self._shortcut_stop_harvest)
-        add_mod_shortcut(".", self._shortcut_stop_harvest)
-        add_mod_shortcut("R", self._shortcut_refresh_dashboard)
-
     def _shortcut_start_harvest(self):
         """Keyboard shortcut handler: navigate to Harvest tab and start the run."""
-        if self.harvest_tab.is_running:
+        harvest_tab = self.harvest_tab
+        if harvest_tab.is_running:
             return
         self.btn_harvest.click()
-        if self.harvest_tab.btn_start.isEnabled():
-            self.harvest_tab.btn_start.click()
+        btn_start = harvest_tab.btn_start
+        if btn_start.isEnabled():
+            btn_start.click()
 
     def _shortcut_stop_harvest(self):
         """Keyboard shortcut handler: stop the currently-running harvest."""
@@ -357,13 +435,13 @@ class ModernMainWindow(QMainWindow):
         """Expand or collapse the sidebar, optionally using a smooth animation.
 
         When collapsed the sidebar is 72 px wide (icon-only mode); when expanded
-        it is 240 px wide (icon + label mode).  Both ``minimumWidth`` and
-        ``maximumWidth`` are animated in parallel so Qt does not clip the frame
-        during the transition.
+        it is 240 px wide (icon + label mode).  A single ``QVariantAnimation``
+        drives ``setFixedWidth`` so each frame costs one relayout instead of two
+        separate min/max constraint updates.
 
         Args:
             collapsed: ``True`` to collapse, ``False`` to expand.
-            animated: When ``True``, a 300 ms ``InOutQuart`` easing animation is used.
+            animated: When ``True``, a 150 ms ``InOutQuart`` easing animation is used.
         """
         if self.sidebar_collapsed == collapsed and animated:
             return
@@ -371,45 +449,55 @@ class ModernMainWindow(QMainWindow):
         self.sidebar_collapsed = collapsed
         width = 72 if collapsed else 240
 
+        if self._sidebar_anim is not None:
+            self._sidebar_anim.stop()
+
         if animated:
-            # Animate both constraints simultaneously so the frame resizes smoothly.
-            self.anim = QPropertyAnimation(self.sidebar, b"minimumWidth")
-            self.anim.setDuration(300)
-            self.anim.setStartValue(self.sidebar.width())
-            self.anim.setEndValue(width)
-            self.anim.setEasingCurve(QEasingCurve.Type.InOutQuart)
-
-            self.anim2 = QPropertyAnimation(self.sidebar, b"maximumWidth")
-            self.anim2.setDuration(300)
-            self.anim2.setStartValue(self.sidebar.width())
-            self.anim2.setEndValue(width)
-
-            # QParallelAnimationGroup fires both animations at the same time.
-            self.anim_group = QParallelAnimationGroup()
-            self.anim_group.addAnimation(self.anim)
-            self.anim_group.addAnimation(self.anim2)
-            self.anim_group.start()
+            if self._sidebar_anim is None:
+                self._sidebar_anim = QVariantAnimation(self)
+                self._sidebar_anim.setDuration(150)
+                self._sidebar_anim.setEasingCurve(QEasingCurve.Type.InOutQuart)
+                self._sidebar_anim.valueChanged.connect(self.sidebar.setFixedWidth)
+                self._sidebar_anim.finished.connect(self._on_sidebar_anim_finished)
+            self._sidebar_anim.setStartValue(self.sidebar.width())
+            self._sidebar_anim.setEndValue(width)
+            self._sidebar_anim.start()
         else:
             # Instant resize (used during window resize events to avoid lag).
-            self.sidebar.setMinimumWidth(width)
-            self.sidebar.setMaximumWidth(width)
+            self.sidebar.setFixedWidth(width)
 
         # Flip the toggle chevron to indicate the new state.
         icon = SVG_CHEVRON_RIGHT if collapsed else SVG_CHEVRON_LEFT
         self.toggle_btn.setIcon(get_icon(icon, "#8aadf4"))
 
-        # Update Text Visibility
-        self.title_label.setVisible(not self.sidebar_collapsed)
+        # Labels are dropped before a collapse starts, but only restored once an
+        # expand has finished, so the animation frames never lay out button text.
+        if collapsed or not animated:
+            self._apply_sidebar_labels(collapsed)
 
-        for btn in self.nav_group.buttons():
-            if collapsed:
-                # Icon-only mode: clear label text and show tooltip instead.
-                btn.setText("")
-                btn.setToolTip(btn.property("full_text"))
-            else:
-                # Expanded mode: show label text and disable tooltip (redundant).
-                btn.setText("  " + btn.property("full_text"))
-                btn.setToolTip("")
+    def _on_sidebar_anim_finished(self):
+        """Restore sidebar labels once an expand animation reaches full width."""
+        if not self.sidebar_collapsed:
+            self._apply_sidebar_labels(False)
+
+    def _apply_sidebar_labels(self, collapsed: bool):
+        """Show or hide the sidebar's text labels for the given collapsed state."""
+        self.title_label.setVisible(not collapsed)
+
+        # Hold sidebar repaints so the buttons relayout in one pass.
+        self.sidebar.setUpdatesEnabled(False)
+        try:
+            for btn, full_text in self._nav_button_texts:
+                if collapsed:
+                    # Icon-only mode: clear label text and show tooltip instead.
+                    btn.setText("")
+                    btn.setToolTip(full_text)
+                else:
+                    # Expanded mode: show label text and disable tooltip (redundant).
+                    btn.setText("  " + full_text)
+                    btn.setToolTip("")
+        finally:
+            self.sidebar.setUpdatesEnabled(True)
 
         # Show / hide sidebar status text on collapse
         if hasattr(self, 'sidebar_status'):
@@ -439,6 +527,12 @@ class ModernMainWindow(QMainWindow):
             self._sidebar_auto_collapsed = False
             self._set_sidebar_collapsed(False, animated=False)
 
+    def changeEvent(self, event):
+        """Catch the dashboard up when the window is restored from minimized."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange and not self.isMinimized():
+            self.dashboard_tab.flush_pending_refresh()
+
     def _on_nav_clicked(self, btn):
         """Handle a sidebar nav-button click and switch the stacked page.
 
@@ -450,7 +544,7 @@ class ModernMainWindow(QMainWindow):
             return
 
         current_index = self.stack.currentIndex()
-        index = btn.property("page_index")
+        index = btn._page_index
         # Guard: prompt for unsaved changes when leaving the Configure page.
         if current_index == 0 and index != 0:
             if not self.targets_config_tab.resolve_unsaved_changes():
@@ -459,7 +553,7 @@ class ModernMainWindow(QMainWindow):
                     (
                         candidate
                         for candidate in self.nav_group.buttons()
-                        if candidate.property("page_index") == current_index
+                        if candidate._page_index == current_index
                     ),
                     None,
                 )
@@ -472,12 +566,13 @@ class ModernMainWindow(QMainWindow):
                 btn.setChecked(False)
                 btn.blockSignals(False)
                 return
+        # Build a deferred page on its first visit before switching to it.
+        current_page = self._materialize_page(index)
         self.stack.setCurrentIndex(index)
-        current_page = self.stack.widget(index)
         if hasattr(current_page, "current_page_title"):
             self.page_title.setText(current_page.current_page_title())
         else:
-            self.page_title.setText(btn.property("full_text"))
+            self.page_title.setText(btn._full_text)
 
     def _connect_signals(self):
         """Wire all inter-tab signals after every widget has been constructed."""
@@ -488,6 +583,7 @@ class ModernMainWindow(QMainWindow):
         self.harvest_tab.result_files_ready.connect(self.dashboard_tab.set_result_files)
         self.harvest_tab.harvest_reset.connect(self._on_harvest_reset)
         self.harvest_tab.harvest_paused.connect(self._on_harvest_paused)
+        self.harvest_tab.marc_import_active.connect(self._on_marc_import_active)
         
         # Live Dashboard Updates
         self.harvest_tab.progress_updated.connect(self._on_harvest_progress)
@@ -513,7 +609,6 @@ class ModernMainWindow(QMainWindow):
         self.dashboard_tab.page_title_changed.connect(self.page_title.setText)
         self.dashboard_tab.pause_harvest_requested.connect(self.harvest_tab._toggle_pause)
         self.dashboard_tab.cancel_harvest_requested.connect(self.harvest_tab.stop_harvest)
-        self.help_tab.page_title_changed.connect(self.page_title.setText)
 
         # Keep tab state fresh when navigating
         self.stack.currentChanged.connect(self._on_page_changed)
@@ -561,7 +656,7 @@ class ModernMainWindow(QMainWindow):
         
         # Real-time results update - only fall back to refresh if live_stats_ready is not connected
         if status in ("found", "failed", "cached", "skipped") and not getattr(self.harvest_tab, 'live_stats_ready', None):
-            self.dashboard_tab.refresh_data()
+            self.dashboard_tab.request_refresh()
 
     def _sync_tab_state(self):
         """Initial cross-tab synchronization after signals are connected."""
@@ -584,7 +679,7 @@ class ModernMainWindow(QMainWindow):
         self.config_tab.refresh_targets_preview(targets)
         # Only refresh DB stats if not actively streaming live data
         if not getattr(self.harvest_tab, 'is_running', False):
-            self.dashboard_tab.refresh_data()
+            self.dashboard_tab.request_refresh()
 
     def _refresh_dashboard_profile_controls(self):
         """Push the current profile list and active profile name to the dashboard combo."""
@@ -600,8 +695,11 @@ class ModernMainWindow(QMainWindow):
         """
         if not name:
             return
-        self.config_tab.select_profile(name)
-        # If user cancels due to unsaved changes, resync displayed selection.
+        # select_profile drives the combo programmatically, which a disabled
+        # ConfigTab does not stop, so refuse while a MARC import is writing.
+        if not self._marc_import_active:
+            self.config_tab.select_profile(name)
+        # If the switch was cancelled or refused, resync displayed selection.
         self._refresh_dashboard_profile_controls()
         self._refresh_targets_profile_controls()
 
@@ -619,7 +717,10 @@ class ModernMainWindow(QMainWindow):
         """
         if not name:
             return
-        self.config_tab.select_profile(name)
+        # select_profile drives the combo programmatically, which a disabled
+        # ConfigTab does not stop, so refuse while a MARC import is writing.
+        if not self._marc_import_active:
+            self.config_tab.select_profile(name)
         self._refresh_dashboard_profile_controls()
         self._refresh_targets_profile_controls()
 
@@ -642,7 +743,7 @@ class ModernMainWindow(QMainWindow):
         self._refresh_dashboard_profile_controls()
         self._refresh_targets_profile_controls()
         self.harvest_tab.reset_for_profile_switch()
-        self.dashboard_tab.refresh_data()
+        self.dashboard_tab.request_refresh()
 
     def _on_page_changed(self, index):
         """Refresh dependent tabs on navigation to keep views current.
@@ -651,7 +752,7 @@ class ModernMainWindow(QMainWindow):
             0 = Dashboard, 1 = Configure, 2 = Harvest, 3 = Help
         """
         if index == 0:  # Dashboard
-            self.dashboard_tab.refresh_data()
+            self.dashboard_tab.request_refresh()
         elif index == 1:  # Configure (Targets + Settings)
             self.targets_tab.refresh_targets()
             self.config_tab.refresh_targets_preview()
@@ -659,10 +760,17 @@ class ModernMainWindow(QMainWindow):
     # --- Logic ---
 
     def _apply_advanced_mode(self):
-        for tab in [self.dashboard_tab, self.targets_config_tab,
-                   self.harvest_tab]:
-            if hasattr(tab, 'set_advanced_mode'):
+        if self._applied_advanced_mode == self.advanced_mode:
+            return
+        # Suspend repaints on the page stack so any layout changes the tabs
+        # make are coalesced into a single update once every tab has run.
+        self.stack.setUpdatesEnabled(False)
+        try:
+            for tab in self._mode_aware_tabs:
                 tab.set_advanced_mode(self.advanced_mode)
+        finally:
+            self.stack.setUpdatesEnabled(True)
+        self._applied_advanced_mode = self.advanced_mode
 
     def _on_harvest_started(self):
         """React to the harvest worker signalling that a run has begun."""
@@ -683,9 +791,12 @@ class ModernMainWindow(QMainWindow):
             stats: Dict containing harvest outcome counters and optional ``cancelled``
                    / ``error`` keys, or a non-dict value when unavailable.
         """
-        from datetime import datetime
-        is_cancelled = isinstance(stats, dict) and stats.get("cancelled", False)
-        has_error = isinstance(stats, dict) and bool(stats.get("error"))
+        # Normalise once; ``stats`` may be a non-dict when unavailable.
+        is_map = isinstance(stats, dict)
+        stats = stats if is_map else {}
+        is_cancelled = stats.get("cancelled", False)
+        error_msg = stats.get("error")
+        has_error = bool(error_msg)
         if success:
             self._set_sidebar_status("Completed", "success")
             outcome = "Completed"
@@ -701,15 +812,15 @@ class ModernMainWindow(QMainWindow):
 
         # Update "Last Run" with a real timestamp
         ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # The dashboard refresh copies last_run_text into its label.
         self.dashboard_tab.last_run_text = f"Last Run: {ts} – {outcome}"
-        self.dashboard_tab.lbl_last_run.setText(self.dashboard_tab.last_run_text)
-
-        self.dashboard_tab.refresh_data()
-        self.dashboard_tab.apply_run_stats(stats if isinstance(stats, dict) else {})
+        self.dashboard_tab.request_refresh()
+        self.dashboard_tab.apply_run_stats(stats)
 
-        if isinstance(stats, dict) and not stats.get("cancelled", False) and not success:
-            error_msg = stats.get("error", "Harvest stopped or failed") if isinstance(stats, dict) else "Harvest stopped or failed"
-            self.notification_manager.notify_harvest_error(error_msg)
+        if is_map and not is_cancelled and not success:
+            self.notification_manager.notify_harvest_error(
+                error_msg if "error" in stats else "Harvest stopped or failed"
+            )
 
         self.dashboard_tab.set_idle(success)
 
@@ -721,6 +832,20 @@ class ModernMainWindow(QMainWindow):
             self._set_sidebar_status("Running", "running")
         self.dashboard_tab.set_paused(is_paused)
 
+    def _on_marc_import_active(self, active: bool):
+        """Lock profile settings while a MARC import writes to the active profile.
+
+        The import saves its source name into the active profile and writes to
+        that profile's database, so switching or editing profiles mid-write is
+        blocked until it finishes: ConfigTab is disabled, the dashboard and
+        targets profile controls are turned off, and the ``_on_*_profile_selected``
+        handlers refuse while ``_marc_import_active`` is set.
+        """
+        self._marc_import_active = active
+        self.config_tab.setEnabled(not active)
+        self.dashboard_tab.set_profile_controls_enabled(not active)
+        self.targets_config_tab.set_profile_controls_enabled(not active)
+
     def _on_harvest_reset(self):
         """Called when user presses New Harvest — reset sidebar pill and dashboard status to Idle."""
         self._set_sidebar_status("Idle", "idle")
@@ -738,9 +863,12 @@ class ModernMainWindow(QMainWindow):
             state: QSS property value matched by the ``StatusPill`` style rules
                    (``"idle"``, ``"running"``, ``"paused"``, ``"success"``, ``"error"``).
         """
-        if hasattr(self, "status_pill"):
-            self.status_pill.setText(text)
-        self.sidebar_status.setText(f"● {text}")
+        label = f"● {text}"
+        # Skip the restyle when nothing changed (e.g. repeated "Running").
+        if self.sidebar_status.text() == label and self.sidebar_status.property("state") == state:
+            return
+        # status_pill is an alias of sidebar_status, so one setText covers both.
+        self.sidebar_status.setText(label)
         self.sidebar_status.setProperty("state", state)
         # unpolish/polish forces Qt to re-read the dynamic property and apply the
         # matching QSS rule (e.g. StatusPill[state="running"] { color: blue; }).
@@ -748,7 +876,19 @@ class ModernMainWindow(QMainWindow):
         self.sidebar_status.style().polish(self.sidebar_status)
 
     def closeEvent(self, event):
-        """Prompt the user before closing if a harvest is still in progress."""
+        """Prompt the user before closing if a harvest is still in progress.
+
+        Closing is refused outright while a MARC import is saving to the
+        database, so the write is never cut off mid-transaction.
+        """
+        if self.harvest_tab.marc_import_running:
+            QMessageBox.information(
+                self,
+                "MARC Import",
+                "A MARC import is still saving to the database. Please wait for it to finish.",
+            )
+            event.ignore()
+            return
         if self.harvest_tab.is_running:
             reply = QMessageBox.question(self, "Harvesting", "Stop harvest and exit?",
                                          QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
@@ -774,31 +914,30 @@ class ModernMainWindow(QMainWindow):
         """Apply the requested color theme using the shared stylesheet helpers.
 
         Strategy:
-        - Generate the complete application stylesheet based on the active mode.
+        - Look up the cached application stylesheet for the active mode.
         - Persist the selection via ThemeManager.
         """
         try:
             mode = theme if isinstance(theme, str) and theme in ("dark", "light") else self._theme_manager.get_theme()
 
+            qss = stylesheet_for_theme(mode)
             if mode == "light":
-                qss = generate_stylesheet(CATPPUCCIN_LIGHT)
                 if hasattr(self, 'btn_theme'):
                     self.btn_theme.setIcon(get_icon(SVG_TOGGLE_OFF, CATPPUCCIN_LIGHT['text_muted']))
                     if not self.sidebar_collapsed:
                         self.btn_theme.setText("Theme: Light")
             else:
-                qss = generate_stylesheet(CATPPUCCIN_DARK)
                 if hasattr(self, 'btn_theme'):
                     self.btn_theme.setIcon(get_icon(SVG_TOGGLE_ON, CATPPUCCIN_DARK['primary']))
                     if not self.sidebar_collapsed:
                         self.btn_theme.setText("Theme: Dark")
                 
-            from PyQt6.QtWidgets import QApplication
+            # Re-applying an identical stylesheet still re-polishes every
+            # widget, so only set it when the theme actually changes.
             app = QApplication.instance()
-            if app:
-                app.setStyleSheet(qss)
-            else:
-                self.setStyleSheet(qss)
+            target = app if app else self
+            if target.styleSheet() != qss:
+                target.setStyleSheet(qss)
 
             # Persist selection
             try:
@@ -809,8 +948,9 @@ class ModernMainWindow(QMainWindow):
             # Notify tabs that use inline theme-specific styles
             try:
                 colors = CATPPUCCIN_LIGHT if mode == "light" else CATPPUCCIN_DARK
-                if hasattr(self, "help_tab"):
-                    self.help_tab.refresh_theme(colors)
+                # An unbuilt Help page reads the saved theme when it is created.
+                if getattr(self, "_help_tab", None) is not None:
+                    self._help_tab.refresh_theme(colors)
                 if hasattr(self, "harvest_tab") and hasattr(self.harvest_tab, "_apply_db_only_checkbox_style"):
                     self.harvest_tab._apply_db_only_checkbox_style()
                 if hasattr(self, "targets_tab"):
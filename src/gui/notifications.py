@@ -13,6 +13,7 @@ for maximum visibility, regardless of tray availability.
 ``NotificationPreferences`` handles loading/saving per-user preferences from
 ``data/notification_prefs.json``.
 """
+import json
 import logging
 import platform
 import subprocess
@@ -260,8 +261,6 @@ class NotificationPreferences:
 
     def _load_preferences(self):
         """Load notification preferences."""
-        import json
-
         defaults = {
             "enabled": True,
             "show_milestones": True,
@@ -285,8 +284,6 @@ class NotificationPreferences:
 
     def save_preferences(self):
         """Save notification preferences."""
-        import json
-
         try:
             self.preferences_file.parent.mkdir(parents=True, exist_ok=True)
             with open(self.preferences_file, 'w') as f:
@@ -11,7 +11,7 @@ Key design points:
 - Shortcuts are defined in ``_get_shortcuts_data`` and automatically
   translated from ``Ctrl+`` to ``Cmd+`` notation for macOS users via
   ``_macify``.
-- The dialog self-applies the full application stylesheet (``generate_stylesheet``)
+- The dialog self-applies the full application stylesheet (``stylesheet_for_theme``)
   augmented with a ``#CategoryHeader`` rule so category headings are visually
   distinct.
 """
@@ -23,7 +23,7 @@ from PyQt6.QtCore import Qt
 import sys
 
 from .theme_manager import ThemeManager
-from .styles import generate_stylesheet, CATPPUCCIN_DARK, CATPPUCCIN_LIGHT
+from .styles import stylesheet_for_theme
 
 
 class ShortcutItem(QFrame):
@@ -67,7 +67,7 @@ class ShortcutsDialog(QDialog):
     """Searchable modal dialog listing all application keyboard shortcuts.
 
     The dialog is self-styled: it applies the full application stylesheet from
-    ``generate_stylesheet`` plus an additional ``QLabel#CategoryHeader`` rule
+    ``stylesheet_for_theme`` plus an additional ``QLabel#CategoryHeader`` rule
     for bold section headings.  Platform detection ensures macOS users see
     ``Cmd+`` notation throughout.
     """
@@ -106,11 +106,10 @@ class ShortcutsDialog(QDialog):
         """
         theme_mgr = ThemeManager()
         mode = theme_mgr.get_theme()
-        palette = CATPPUCCIN_DARK if mode == "dark" else CATPPUCCIN_LIGHT
         # Category headers need high-contrast text; white on dark, black on light.
         category_color = "#ffffff" if mode == "dark" else "#000000"
         self.setStyleSheet(
-            generate_stylesheet(palette)
+            stylesheet_for_theme(mode)
             + f"""
             QLabel#CategoryHeader {{
                 color: {category_color};
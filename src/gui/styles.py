@@ -23,6 +23,9 @@ Design notes:
 - SVG-based combo-box arrows are written to a temp file by ``get_svg_file`` so
   QSS ``url(...)`` references resolve correctly on all platforms.
 """
+import os
+import tempfile
+from functools import lru_cache
 
 CATPPUCCIN_DARK = {
     # ── Surface hierarchy ──────────────────────────────────────────────
@@ -142,9 +145,6 @@ def generate_stylesheet(theme: dict) -> str:
         Returns:
             Absolute POSIX-style path to the written SVG file.
         """
-        import os
-        import tempfile
-
         # Substitute the placeholder with the desired tint color.
         colored = svg_string.replace('CURRENT_COLOR', color_hex)
         temp_dir = tempfile.gettempdir()
@@ -197,6 +197,13 @@ QLabel#SidebarTitle {{
     qproperty-alignment: AlignCenter;
 }}
 
+/* Icon-only collapse/expand chevron in the sidebar header.  Styled here
+   rather than inline so the rule is parsed once with the app stylesheet. */
+QPushButton#SidebarToggle {{
+    background: transparent;
+    border: none;
+}}
+
 /* Sidebar Navigation Buttons
    Three selector forms are provided (class attribute, CSS class, objectName)
    to ensure the rule fires regardless of how the property was assigned in
@@ -1236,3 +1243,16 @@ QFrame[class="MarcDropZone"] {{
 # because Python caches the module; callers that always want the current
 # theme should call generate_stylesheet(palette) directly.
 DEFAULT_STYLESHEET = generate_stylesheet(CATPPUCCIN_DARK)
+
+
+@lru_cache(maxsize=None)
+def stylesheet_for_theme(mode: str) -> str:
+    """Return the application QSS for ``"light"`` or ``"dark"`` mode.
+
+    Each mode's stylesheet is generated once and reused, so theme toggles and
+    themed dialogs do not rebuild the full QSS string on every call.  Any mode
+    other than ``"light"`` maps to the dark stylesheet.
+    """
+    if mode == "light":
+        return generate_stylesheet(CATPPUCCIN_LIGHT)
+    return DEFAULT_STYLESHEET
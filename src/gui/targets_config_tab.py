@@ -98,6 +98,10 @@ class TargetsConfigTab(QWidget):
         """Forward profile list updates to TargetsTab."""
         self.targets_tab.set_profile_options(profiles, current)
 
+    def set_profile_controls_enabled(self, enabled):
+        """Forward the profile-switching lock to TargetsTab."""
+        self.targets_tab.set_profile_controls_enabled(enabled)
+
     def set_advanced_mode(self, enabled):
         """Forward advanced-mode toggle to TargetsTab."""
         self.targets_tab.set_advanced_mode(enabled)
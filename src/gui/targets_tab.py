@@ -163,7 +163,7 @@ class TargetsTab(QWidget):
         self.search_clear_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.search_clear_btn.setToolTip("Clear search")
         self.search_clear_btn.hide()
-        self.search_clear_btn.clicked.connect(lambda: self.search_edit.clear())
+        self.search_clear_btn.clicked.connect(self.search_edit.clear)
         self.search_edit.textChanged.connect(lambda t: self.search_clear_btn.setVisible(bool(t)))
 
         search_layout.addWidget(self.search_edit)
@@ -208,7 +208,7 @@ class TargetsTab(QWidget):
         self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
         # Table inherits global stylesheet
 
-        self.table.itemDoubleClicked.connect(lambda item: self._edit_target_from_item(item))
+        self.table.itemDoubleClicked.connect(self._edit_target_from_item)
 
         # Ensure the table always shows a reasonable minimum height
         self.table.setMinimumHeight(200)
@@ -218,6 +218,10 @@ class TargetsTab(QWidget):
         """Compatibility no-op: profile selection lives in the settings card above."""
         return None
 
+    def set_profile_controls_enabled(self, enabled: bool):
+        """Compatibility no-op: profile selection lives in the settings card above."""
+        return None
+
     def _emit_targets_changed(self):
         """Emit ``targets_changed`` with the current normalised targets list."""
         self.targets_changed.emit(self.get_targets())
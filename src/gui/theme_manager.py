@@ -9,7 +9,7 @@ Theme-switching flow in the application:
     1. The user clicks the theme toggle in ``ModernMainWindow``.
     2. ``ModernMainWindow._apply_theme`` calls ``ThemeManager().set_theme(mode)``
        which persists the new value to disk.
-    3. ``_apply_theme`` then calls ``app.setStyleSheet(generate_stylesheet(palette))``
+    3. ``_apply_theme`` then calls ``app.setStyleSheet(stylesheet_for_theme(mode))``
        to replace the global QSS, and calls ``HelpTab.refresh_theme(colors)`` to
        update inline styles that live outside the QSS cascade.
     4. On the next cold start, ``ThemeManager().get_theme()`` returns the saved
@@ -20,16 +20,80 @@ Stored keys:
     ``last_profile`` — Display name of the most recently active profile.
 """
 import json
+import logging
+import os
+import threading
 from pathlib import Path
 from typing import Literal
 
+from PyQt6.QtCore import QCoreApplication, QThreadPool
+
+logger = logging.getLogger(__name__)
+
+# Parsed settings keyed by file path, stored as ``(st_mtime_ns, settings)``.
+# ThemeManager is instantiated on every theme lookup, so re-parsing the file
+# each time is wasted work unless it actually changed on disk.
+_SETTINGS_CACHE: dict[Path, tuple[int, dict]] = {}
+
+# Settings saved on the GUI thread but not yet written by the background
+# writer, keyed by file path.  Readers prefer these over the file so a new
+# ThemeManager never sees a value older than the last one set.
+_PENDING_WRITES: dict[Path, dict] = {}
+_PENDING_LOCK = threading.Lock()
+# Serialises the actual file writes; pool threads may run concurrently.
+_WRITE_LOCK = threading.Lock()
+# Whether _flush_pending_writes is connected to QCoreApplication.aboutToQuit.
+_FLUSH_ON_QUIT_CONNECTED = False
+
+
+def _write_settings(path: Path):
+    """Write the newest pending settings for *path* to disk atomically.
+
+    Runs on a pool thread.  Only the latest pending dict is written, so a
+    burst of saves collapses into as few writes as the pool gets to run.
+    """
+    with _WRITE_LOCK:
+        with _PENDING_LOCK:
+            settings = _PENDING_WRITES.get(path)
+        if settings is None:
+            return  # An earlier task already wrote the newest value.
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + ".tmp")
+            # Compact output: the file is machine-managed, so pretty-printing
+            # only adds formatting work and bytes to every save.
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(settings, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+            _SETTINGS_CACHE[path] = (path.stat().st_mtime_ns, settings)
+        except Exception as e:
+            # Never fatal (e.g. a packaged app on a read-only install), but
+            # leave a trace in the log rather than dropping it silently.
+            logger.warning("Failed to save GUI settings to %s: %s", path, e)
+        with _PENDING_LOCK:
+            if _PENDING_WRITES.get(path) is settings:
+                del _PENDING_WRITES[path]
+
+
+def _flush_pending_writes():
+    """Write every pending settings dict to disk on the calling thread.
+
+    Connected to ``QCoreApplication.aboutToQuit`` so a save that is still
+    queued on the pool when the app exits is not lost.
+    """
+    with _PENDING_LOCK:
+        paths = list(_PENDING_WRITES)
+    for path in paths:
+        _write_settings(path)
+
 
 class ThemeManager:
     """Reads and writes GUI preferences to ``data/gui_settings.json``.
 
     The class is intentionally stateless between instantiations: each call to
-    ``__init__`` reloads the settings file so two instances always agree on the
-    current values.
+    ``__init__`` re-checks the settings file so two instances always agree on the
+    current values.  The parsed contents are cached per file and only re-read
+    when the file's modification time changes.
     """
 
     def __init__(self):
@@ -38,9 +102,6 @@ class ThemeManager:
         # Store settings under data/ so they survive source-tree updates and
         # are not accidentally committed alongside code changes.
         self.settings_file = self.app_root / "data" / "gui_settings.json"
-        # Ensure the parent directory exists; required on first run or after a
-        # clean checkout where data/ is not present.
-        self.settings_file.parent.mkdir(parents=True, exist_ok=True)
         self._load_settings()
 
     def _load_settings(self):
@@ -50,14 +111,26 @@ class ThemeManager:
         default settings so a corrupted file never prevents the app from
         starting.
         """
+        with _PENDING_LOCK:
+            pending = _PENDING_WRITES.get(self.settings_file)
+        if pending is not None:
+            self.settings = dict(pending)
+            return
         try:
-            if self.settings_file.exists():
-                with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    self.settings = json.load(f)
-            else:
+            try:
+                mtime_ns = self.settings_file.stat().st_mtime_ns
+            except FileNotFoundError:
                 # First run: initialise and persist the defaults immediately.
                 self.settings = self._create_default_settings()
                 self._save_settings()
+                return
+            cached = _SETTINGS_CACHE.get(self.settings_file)
+            if cached is None or cached[0] != mtime_ns:
+                with open(self.settings_file, 'r', encoding='utf-8') as f:
+                    cached = (mtime_ns, json.load(f))
+                _SETTINGS_CACHE[self.settings_file] = cached
+            # Copy so edits on this instance never leak into the shared cache.
+            self.settings = dict(cached[1])
         except Exception:
             # Corrupted or unreadable file — fall back to defaults in memory.
             self.settings = self._create_default_settings()
@@ -77,14 +150,26 @@ class ThemeManager:
     def _save_settings(self):
         """Persist the current in-memory settings dict to the JSON file.
 
-        Any I/O error is silently swallowed so a read-only filesystem (e.g. a
-        packaged app running from a protected directory) never crashes the GUI.
+        The write runs on ``QThreadPool.globalInstance()`` so a slow disk never
+        stalls the GUI thread; without a running Qt application it happens
+        inline.  Anything still queued at shutdown is flushed from
+        ``aboutToQuit``.  I/O errors are logged as warnings and never raised,
+        so a read-only filesystem (e.g. a packaged app running from a
+        protected directory) never crashes the GUI.
         """
-        try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=2)
-        except Exception:
-            pass  # Silently fail if we can't write settings
+        with _PENDING_LOCK:
+            _PENDING_WRITES[self.settings_file] = dict(self.settings)
+        app = QCoreApplication.instance()
+        if app is None:
+            _write_settings(self.settings_file)
+        else:
+            global _FLUSH_ON_QUIT_CONNECTED
+            if not _FLUSH_ON_QUIT_CONNECTED:
+                app.aboutToQuit.connect(_flush_pending_writes)
+                _FLUSH_ON_QUIT_CONNECTED = True
+            QThreadPool.globalInstance().start(
+                lambda path=self.settings_file: _write_settings(path)
+            )
 
     def get_theme(self) -> Literal["dark", "light"]:
         """Return the current theme mode, defaulting to ``"light"`` if invalid.
@@ -106,6 +191,10 @@ class ThemeManager:
             theme: ``"dark"`` or ``"light"``.
         """
         if isinstance(theme, str) and theme in ("dark", "light"):
+            # The window re-applies the theme on every launch; skip the write
+            # when the stored value is already correct.
+            if self.settings.get("theme") == theme:
+                return
             self.settings["theme"] = theme
             self._save_settings()
 
@@ -124,6 +213,8 @@ class ThemeManager:
         Args:
             profile_name: Display name of the active profile.
         """
+        if self.settings.get("last_profile") == profile_name:
+            return
         self.settings["last_profile"] = profile_name
         self._save_settings()
 
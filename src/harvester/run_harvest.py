@@ -7,6 +7,8 @@ GUI harvest tab and the CLI.
 
 Public API:
     parse_isbn_file(path)  -- Read an ISBN file and return validated, deduplicated ISBNs.
+    parse_isbn_file_cached(path) -- Same, memoised on (path, mtime, size, max_lines).
+    evict_parsed_isbn_file(path) -- Drop a cached parse once it has been consumed.
     run_harvest(path, ...) -- Full pipeline: parse → configure targets → run → return summary.
 
 Supported input formats:
@@ -24,7 +26,10 @@ from __future__ import annotations
 
 import csv
 import logging
+import os
+import threading
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
 
 from src.database import DatabaseManager
@@ -34,6 +39,14 @@ from src.utils import isbn_validator
 
 logger = logging.getLogger(__name__)
 
+# Read buffer for TSV/CSV input files; a 1 MiB buffer cuts read() syscalls
+# roughly 128x versus the 8 KiB default on large inputs and network drives.
+_INPUT_READ_BUFFER_SIZE = 1 << 20
+# First-cell values recognised as a column header rather than an ISBN.  Only
+# consulted until the first data row is seen (the ``and`` short-circuits), so
+# the per-row cost after that is a single flag test.
+_HEADER_TOKENS = frozenset({"isbn", "isbns", "isbn13", "isbn10"})
+
 
 @dataclass(frozen=True)
 class HarvestSummary:
@@ -137,11 +150,10 @@ def parse_isbn_file(input_path: Path, max_lines: int = 0) -> ParsedISBNFile:
             # Read first sheet, no headers assumed to get raw data
             df = pd.read_excel(input_path, header=None, engine='openpyxl' if suffix == '.xlsx' else None)
             first_data_row_seen = False
+            if max_lines:
+                df = df.iloc[:max_lines]
 
-            for i, row in df.iterrows():
-                if max_lines and i >= max_lines:
-                    break
-                
+            for _, row in df.iterrows():
                 # Check entirely empty row
                 if row.isna().all():
                     continue
@@ -155,7 +167,7 @@ def parse_isbn_file(input_path: Path, max_lines: int = 0) -> ParsedISBNFile:
                 if not raw_isbn or raw_isbn.startswith("#"):
                     continue
 
-                if not first_data_row_seen and raw_isbn.lower() in {"isbn", "isbns", "isbn13", "isbn10"}:
+                if not first_data_row_seen and raw_isbn.lower() in _HEADER_TOKENS:
                     first_data_row_seen = True
                     continue
 
@@ -195,15 +207,15 @@ def parse_isbn_file(input_path: Path, max_lines: int = 0) -> ParsedISBNFile:
             logger.error(f"Failed parsing Excel file: {e}")
 
     else:
-        with input_path.open("r", encoding="utf-8-sig", newline="") as f:
+        with input_path.open(
+            "r", encoding="utf-8-sig", newline="", buffering=_INPUT_READ_BUFFER_SIZE
+        ) as f:
             delimiter = "," if suffix == ".csv" else "\t"
             reader = csv.reader(f, delimiter=delimiter)
             first_data_row_seen = False
 
-            for i, row in enumerate(reader, start=1):
-                if max_lines and i > max_lines:
-                    break
-
+            # islice applies the line cap in C rather than testing a counter per row.
+            for row in islice(reader, max_lines or None):
                 # Check if entirely empty
                 if not row or not "".join(row).strip():
                     continue
@@ -214,7 +226,7 @@ def parse_isbn_file(input_path: Path, max_lines: int = 0) -> ParsedISBNFile:
                     continue
 
                 # Header skip
-                if not first_data_row_seen and raw_isbn.lower() in {"isbn", "isbns", "isbn13", "isbn10"}:
+                if not first_data_row_seen and raw_isbn.lower() in _HEADER_TOKENS:
                     first_data_row_seen = True
                     continue
 
@@ -250,6 +262,61 @@ def parse_isbn_file(input_path: Path, max_lines: int = 0) -> ParsedISBNFile:
     )
 
 
+# Most recently parsed file keyed by (resolved path, st_mtime_ns, st_size, max_lines).
+# The harvest worker parses the input at start and run_harvest again right
+# after; with the cache only the first of those reads the file.  A parse holds
+# every valid and invalid ISBN, so only one is kept, and run_harvest evicts it
+# once consumed so a finished run does not pin it for the life of the GUI.
+_PARSE_CACHE: dict[tuple[str, int, int, int], ParsedISBNFile] = {}
+_PARSE_CACHE_MAX = 1
+_PARSE_CACHE_LOCK = threading.Lock()
+
+
+def parse_isbn_file_cached(
+    input_path: Path, max_lines: int = 0, st: os.stat_result | None = None
+) -> ParsedISBNFile:
+    """Return ``parse_isbn_file(input_path, max_lines)``, reusing a recent result.
+
+    The cache key includes the file's ``st_mtime_ns`` and ``st_size``, so an
+    edited file is always re-parsed.  Cached results are shared between
+    callers and must be treated as read-only.  Only the parse that fills the
+    cache appends to ``invalid_isbns.log``; a hit reuses it without logging.
+
+    Args:
+        input_path: Path to the input file.
+        max_lines:  Forwarded to ``parse_isbn_file``.
+        st:         The file's ``stat()`` result when the caller already has
+                    one; saves a second round-trip on network drives.
+
+    Raises:
+        OSError: If *input_path* cannot be stat'ed (e.g. it does not exist).
+    """
+    path = Path(input_path)
+    if st is None:
+        st = path.stat()
+    # abspath is pure string work; resolve() would lstat every path component.
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size, int(max_lines or 0))
+    with _PARSE_CACHE_LOCK:
+        cached = _PARSE_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    parsed = parse_isbn_file(path, max_lines=max_lines)
+    with _PARSE_CACHE_LOCK:
+        while len(_PARSE_CACHE) >= _PARSE_CACHE_MAX:
+            _PARSE_CACHE.pop(next(iter(_PARSE_CACHE)))
+        _PARSE_CACHE[key] = parsed
+    return parsed
+
+
+def evict_parsed_isbn_file(input_path: Path) -> None:
+    """Drop every cached parse of *input_path* from ``parse_isbn_file_cached``."""
+    abs_path = os.path.abspath(Path(input_path))
+    with _PARSE_CACHE_LOCK:
+        for key in [k for k in _PARSE_CACHE if k[0] == abs_path]:
+            del _PARSE_CACHE[key]
+
+
 def run_harvest(
     input_path: Path,
     dry_run: bool = False,
@@ -298,7 +365,9 @@ def run_harvest(
     db = DatabaseManager(db_path)
     db.init_db()  # Ensure schema and migrations are applied before any reads/writes
 
-    parsed = parse_isbn_file(input_path)
+    parsed = parse_isbn_file_cached(input_path)
+    # This run is the last consumer; the next run re-parses (and re-logs).
+    evict_parsed_isbn_file(input_path)
     isbns = parsed.unique_valid
 
     if targets is None:
@@ -176,6 +176,63 @@ def test_should_skip_retry(tmp_path: Path):
     assert db.should_skip_retry("1111111111", "Test", "lccn", retry_days=7) is False
 
 
+def test_get_all_attempted_for_many_matches_single_lookups(tmp_path: Path):
+    db_path = tmp_path / "test.sqlite3"
+    db = DatabaseManager(db_path)
+    db.init_db()
+
+    db.upsert_attempted(isbn="1111111111", last_target="LoC", attempt_type="both", last_error="x")
+    db.upsert_attempted(isbn="1111111111", last_target="Harvard", attempt_type="lccn", last_error="y")
+    db.upsert_attempted(isbn="2222222222", last_target="LoC", attempt_type="both", last_error="z")
+
+    batch = db.get_all_attempted_for_many(["1111111111", "2222222222", "3333333333", "1111111111"])
+
+    assert set(batch) == {"1111111111", "2222222222"}
+    for isbn, records in batch.items():
+        single = db.get_all_attempted_for(isbn)
+        assert {(r.last_target, r.attempt_type) for r in records} == {
+            (r.last_target, r.attempt_type) for r in single
+        }
+    assert db.get_all_attempted_for_many([]) == {}
+
+
+def test_isbn_lookups_use_indexes(tmp_path: Path):
+    """Per-ISBN and batched lookups must be index searches, never full scans."""
+    db = DatabaseManager(tmp_path / "test.sqlite3")
+    db.init_db()
+
+    def plan(conn, sql, params=()):
+        return " | ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+
+    with db.connect() as conn:
+        assert "SEARCH main USING" in plan(conn, "SELECT * FROM main WHERE isbn = ?", ("x",))
+        assert "SEARCH attempted USING" in plan(conn, "SELECT * FROM attempted WHERE isbn = ?", ("x",))
+
+        conn.execute("CREATE TEMP TABLE _want_isbns (isbn TEXT PRIMARY KEY) WITHOUT ROWID")
+        batch_plan = plan(
+            conn,
+            "SELECT a.isbn FROM _want_isbns w CROSS JOIN attempted a ON a.isbn = w.isbn "
+            "ORDER BY a.last_attempted DESC",
+        )
+        assert "SEARCH a USING INDEX" in batch_plan
+        assert "SCAN a" not in batch_plan
+
+
+def test_init_db_on_reused_instance_recreates_corrupt_db_in_wal_mode(tmp_path: Path):
+    db_path = tmp_path / "test.sqlite3"
+    db = DatabaseManager(db_path)
+    db.init_db()
+
+    db_path.write_bytes(b"not a sqlite database" * 256)
+    db.init_db()
+
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    finally:
+        conn.close()
+
+
 def test_init_db_recovers_from_legacy_main_table_before_index_creation(tmp_path: Path):
     db_path = tmp_path / "legacy.sqlite3"
 
@@ -81,3 +81,36 @@ def test_clear_input_resets_file_preview(harvest_tab, qapp, tmp_path):
     assert harvest_tab.preview_table.horizontalHeaderItem(0).text() == "ISBN"
     assert harvest_tab.preview_table.horizontalHeaderItem(1).text() == "Status"
     assert harvest_tab.lbl_preview_filename.text() == "No file selected"
+
+
+def test_set_input_file_is_ignored_while_running(harvest_tab, qapp, tmp_path):
+    """A file picked mid-run must not replace the input the worker is using."""
+    from src.gui.harvest_tab import UIState
+
+    first = tmp_path / "first.tsv"
+    first.write_text("isbn\n9780131103627\n", encoding="utf-8")
+    second = tmp_path / "second.tsv"
+    second.write_text("isbn\n9780306406157\n", encoding="utf-8")
+
+    harvest_tab.set_input_file(str(first))
+    harvest_tab.current_state = UIState.RUNNING
+    harvest_tab.set_input_file(str(second))
+
+    assert harvest_tab.input_file == str(first)
+
+
+def test_start_loads_a_drop_still_in_the_debounce_window(harvest_tab, qapp, tmp_path):
+    """Start should use the last dropped file, not the one loaded before it."""
+    first = tmp_path / "first.tsv"
+    first.write_text("isbn\n9780131103627\n", encoding="utf-8")
+    second = tmp_path / "second.tsv"
+    second.write_text("isbn\n9780306406157\n", encoding="utf-8")
+
+    harvest_tab.set_input_file(str(first))
+    harvest_tab._queue_input_file(str(second))
+    # Stop before a worker is started; the pending drop is flushed first.
+    harvest_tab.marc_import_running = True
+    harvest_tab._on_start_clicked()
+
+    assert not harvest_tab._parse_debounce.isActive()
+    assert harvest_tab.input_file == str(second)
@@ -0,0 +1,120 @@
+import random
+import re
+
+from src.gui import input_tab
+from src.gui.input_tab import _FIRST_COLUMN_RE, _scan_file
+
+VALID_A = "9780132350884"
+VALID_B = "9780306406157"
+
+
+def _reference_first_columns(data: bytes) -> list[bytes]:
+    """The original per-line semantics: strip, first tab column, drop comments."""
+    tokens = []
+    # Text-mode iteration splits on universal newlines only, unlike str.splitlines.
+    for line in re.split(r"\r\n|\r|\n", data.decode("utf-8")):
+        raw_line = line.strip()
+        if not raw_line:
+            continue
+        raw_isbn = raw_line.partition("\t")[0].strip()
+        if raw_isbn and not raw_isbn.startswith("#"):
+            tokens.append(raw_isbn.encode("utf-8"))
+    return tokens
+
+
+def _scan(tmp_path, text, *, name="isbns.tsv", encoding="utf-8"):
+    path = tmp_path / name
+    path.write_bytes(text.encode(encoding))
+    return _scan_file(path, path.stat().st_size)
+
+
+def _stats(info_text: str) -> dict[str, int]:
+    stats = {}
+    for line in info_text.splitlines():
+        key, _, value = line.partition(": ")
+        if value.isdigit():
+            stats[key] = int(value)
+    return stats
+
+
+def test_first_column_regex_matches_strip_partition_semantics():
+    alphabet = ["9", "7", "8", "X", "a", "#", " ", "\t", "\f", "\v", "\r", "\n", "\r\n"]
+    rng = random.Random(20261016)
+    for _ in range(2000):
+        data = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40))).encode()
+        got = [t for t in _FIRST_COLUMN_RE.findall(data) if t]
+        assert got == _reference_first_columns(data), data
+
+
+def test_first_column_regex_trims_and_keeps_inner_spaces():
+    data = b"  978 0132 \t second\r\n\t# note\r   \n 9780132350884  \n"
+    assert [t for t in _FIRST_COLUMN_RE.findall(data) if t] == [b"978 0132", b"9780132350884"]
+
+
+def test_scan_file_handles_bom_line_endings_comments_and_header(tmp_path):
+    text = (
+        "ISBN\tTitle\r\n"
+        "# exported list\r\n"
+        f"  {VALID_A}  \tClean Code\r"
+        "\r\n"
+        f"{VALID_B}\n"
+        f"\t{VALID_A}\n"
+        "12345\n"
+    )
+    preview, info = _scan(tmp_path, text, encoding="utf-8-sig")
+
+    assert not preview.startswith("\ufeff")
+    assert _stats(info) == {
+        "Valid ISBNs (unique)": 2,
+        "Valid ISBN rows": 3,
+        "Duplicate valid rows": 1,
+        "Invalid ISBN rows": 1,
+    }
+    assert "Note: Large file detected" not in info
+
+
+def test_scan_file_only_skips_header_on_first_data_row(tmp_path):
+    _, info = _scan(tmp_path, f"# comment\nisbn13\n{VALID_A}\nISBN\n")
+    # The header after the comment is skipped; a later "ISBN" row is invalid data.
+    assert _stats(info)["Valid ISBN rows"] == 1
+    assert _stats(info)["Invalid ISBN rows"] == 1
+
+
+def test_scan_file_samples_large_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(input_tab, "LARGE_FILE_THRESHOLD_BYTES", 0)
+    monkeypatch.setattr(input_tab, "INFO_SAMPLE_MAX_LINES", 3)
+
+    _, info = _scan(tmp_path, f"{VALID_A}\n12345\n{VALID_B}\n{VALID_B}\n67890\n")
+
+    assert _stats(info) == {
+        "Valid ISBNs (unique)": 2,
+        "Valid ISBN rows": 2,
+        "Duplicate valid rows": 0,
+        "Invalid ISBN rows": 1,
+    }
+    assert "based on the first 3 lines" in info
+
+
+def test_scan_file_without_stats_returns_compute_link(tmp_path):
+    path = tmp_path / "big.tsv"
+    path.write_text(f"{VALID_A}\n", encoding="utf-8")
+
+    preview, info = _scan_file(path, path.stat().st_size, with_stats=False)
+
+    assert preview.strip() == VALID_A
+    assert f'href="{input_tab._COMPUTE_STATS_HREF}"' in info
+
+
+def test_scan_file_can_be_cancelled(tmp_path, monkeypatch):
+    monkeypatch.setattr(input_tab, "_INFO_CANCEL_CHECK_LINES", 1)
+    assert _scan(tmp_path, f"{VALID_A}\n") is not None
+
+    path = tmp_path / "isbns.tsv"
+    assert _scan_file(path, path.stat().st_size, should_stop=lambda: True) is None
+
+
+def test_scan_file_reports_read_errors(tmp_path):
+    missing = tmp_path / "missing.tsv"
+    preview, info = _scan_file(missing, 0)
+    assert preview == info
+    assert info.startswith("Error reading file:")
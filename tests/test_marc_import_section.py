@@ -146,5 +146,29 @@ class TestMarcHandlerMethods:
         assert not harvest_tab._btn_import_marc.isEnabled()
 
 
+
+class TestMarcImportWaitCursor:
+    """Test the app-wide wait cursor around the MARC import steps."""
+
+    def test_duplicate_dialog_is_not_shown_under_wait_cursor(self, harvest_tab, qapp):
+        """The conflict dialog waits on the user, so the busy cursor is cleared first."""
+        cursors = []
+
+        def resolve(source_name, parsed_records, existing_rows):
+            cursors.append(QApplication.overrideCursor())
+            return None, parsed_records  # User cancelled the dialog.
+
+        harvest_tab._set_marc_import_running(True)
+        assert QApplication.overrideCursor() is not None
+        harvest_tab._marc_import_ctx = {"source_name": "Test Source", "parsed_records": []}
+
+        with patch.object(harvest_tab, "_resolve_marc_source_conflict", side_effect=resolve):
+            harvest_tab._on_marc_overlap_fetched([("9780131103627",)])
+
+        assert cursors == [None]
+        assert not harvest_tab.marc_import_running
+        assert QApplication.overrideCursor() is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
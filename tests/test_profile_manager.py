@@ -1,4 +1,5 @@
 import importlib
+import os
 import sys
 
 from src.config.profile_manager import ProfileManager
@@ -64,3 +65,37 @@ def test_get_db_path_merges_legacy_profile_db_into_shared(monkeypatch, tmp_path)
     assert attempted_row.last_error == "No records found in LegacyTarget."
     assert linked == ["9780132350884"]
     assert marker.exists()
+
+
+def test_get_active_profile_sees_writes_from_other_instances(monkeypatch, tmp_path):
+    app_paths = importlib.import_module("src.config.app_paths")
+    monkeypatch.setitem(sys.modules, "config.app_paths", app_paths)
+    monkeypatch.setattr(app_paths, "get_app_root", lambda: tmp_path)
+
+    reader = ProfileManager()
+    writer = ProfileManager()
+
+    assert reader.get_active_profile() == "Default Settings"
+    writer.set_active_profile("Abdel")
+    assert reader.get_active_profile() == "Abdel"
+    writer.set_active_profile("Second Profile")
+    assert reader.get_active_profile() == "Second Profile"
+    assert reader.get_active_profile() == "Second Profile"
+
+
+def test_get_active_profile_sees_same_length_switch_within_one_tick(monkeypatch, tmp_path):
+    app_paths = importlib.import_module("src.config.app_paths")
+    monkeypatch.setitem(sys.modules, "config.app_paths", app_paths)
+    monkeypatch.setattr(app_paths, "get_app_root", lambda: tmp_path)
+
+    reader = ProfileManager()
+    writer = ProfileManager()
+
+    writer.set_active_profile("Alpha")
+    assert reader.get_active_profile() == "Alpha"
+    before = reader.active_profile_path.stat()
+
+    # Same length and, as on a coarse FAT/exFAT clock, the same mtime.
+    writer.set_active_profile("Bravo")
+    os.utime(reader.active_profile_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+    assert reader.get_active_profile() == "Bravo"
@@ -7,3 +7,30 @@ def test_run_harvest_smoke(tmp_path: Path):
 
     summary = run_harvest(tsv, dry_run=True)
     assert summary.total_isbns == 2
+
+
+def test_parse_isbn_file_cached_reuses_result_until_file_changes(tmp_path: Path):
+    from src.harvester.run_harvest import parse_isbn_file_cached
+
+    tsv = tmp_path / "isbns.tsv"
+    tsv.write_text("9780132350884\n", encoding="utf-8")
+
+    first = parse_isbn_file_cached(tsv)
+    assert parse_isbn_file_cached(tsv) is first
+    # A different sampling limit is a different cache entry.
+    assert parse_isbn_file_cached(tsv, max_lines=1) is not first
+
+    tsv.write_text("9780132350884\n0000000000\n", encoding="utf-8")
+    assert parse_isbn_file_cached(tsv) is not first
+
+
+def test_run_harvest_evicts_its_cached_parse(tmp_path: Path):
+    from src.harvester.run_harvest import parse_isbn_file_cached
+
+    tsv = tmp_path / "isbns.tsv"
+    tsv.write_text("9780132350884\n", encoding="utf-8")
+
+    first = parse_isbn_file_cached(tsv)
+    run_harvest(tsv, dry_run=True, db_path=tmp_path / "h.sqlite3")
+    # The run consumed the cached parse, so the next lookup parses afresh.
+    assert parse_isbn_file_cached(tsv) is not first
@@ -10,6 +10,7 @@ Tests cover:
 - Tab accessibility attributes
 """
 
+import importlib
 import pytest
 import sys
 from pathlib import Path
@@ -27,6 +28,14 @@ from PyQt6.QtWidgets import QApplication, QPushButton, QMainWindow
 from PyQt6.QtCore import Qt
 
 
+@pytest.fixture(autouse=True)
+def isolated_app_root(monkeypatch, tmp_path):
+    """Keep theme/profile writes out of the repository's data/ directory."""
+    app_paths = importlib.import_module("config.app_paths")
+    monkeypatch.setattr(app_paths, "get_app_root", lambda: tmp_path)
+    return tmp_path
+
+
 class TestSidebarTabsExist:
     """Test that all sidebar tabs are created and accessible."""
 
@@ -374,5 +383,55 @@ class TestStatusPill:
         assert main_window.status_pill.isVisible()
 
 
+
+class TestMarcImportProfileLock:
+    """Test that profiles cannot be switched while a MARC import is saving."""
+
+    @pytest.fixture(scope="session")
+    def qapp(self):
+        """Create QApplication for GUI tests."""
+        app = QApplication.instance()
+        if app is None:
+            app = QApplication(sys.argv)
+        return app
+
+    @pytest.fixture
+    def main_window(self, qapp):
+        """Create main window instance for testing."""
+        with patch('gui.modern_window.NotificationManager'):
+            from gui.modern_window import ModernMainWindow
+            window = ModernMainWindow()
+            window.show()
+            qapp.processEvents()
+            yield window
+            # closeEvent refuses while an import is running.
+            window.harvest_tab.marc_import_active.emit(False)
+            window.close()
+
+    def test_dashboard_profile_switch_is_refused_during_import(self, main_window, qapp):
+        """A dashboard profile pick mid-import must leave the active profile alone."""
+        main_window._profile_manager.save_profile("Other Profile", {})
+        active = main_window._profile_manager.get_active_profile()
+        assert active != "Other Profile"
+
+        main_window.harvest_tab.marc_import_active.emit(True)
+        qapp.processEvents()
+
+        assert not main_window.config_tab.isEnabled()
+        assert not main_window.dashboard_tab._profile_controls_enabled
+
+        main_window.dashboard_tab.profile_selected.emit("Other Profile")
+        qapp.processEvents()
+
+        assert main_window._profile_manager.get_active_profile() == active
+        assert main_window.config_tab.current_profile_name == active
+
+        main_window.harvest_tab.marc_import_active.emit(False)
+        qapp.processEvents()
+
+        assert main_window.config_tab.isEnabled()
+        assert main_window.dashboard_tab._profile_controls_enabled
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,74 @@
+import importlib
+import json
+import sys
+
+from src.gui import theme_manager
+from src.gui.theme_manager import ThemeManager
+
+
+def _use_app_root(monkeypatch, tmp_path):
+    app_paths = importlib.import_module("src.config.app_paths")
+    monkeypatch.setitem(sys.modules, "config.app_paths", app_paths)
+    monkeypatch.setattr(app_paths, "get_app_root", lambda: tmp_path)
+    monkeypatch.setattr(theme_manager, "_SETTINGS_CACHE", {})
+    monkeypatch.setattr(theme_manager, "_PENDING_WRITES", {})
+    return tmp_path / "data" / "gui_settings.json"
+
+
+def test_save_without_qt_app_writes_atomically(monkeypatch, tmp_path):
+    settings_file = _use_app_root(monkeypatch, tmp_path)
+    replaced = []
+    real_replace = theme_manager.os.replace
+
+    def tracking_replace(src, dst):
+        replaced.append((src, dst))
+        real_replace(src, dst)
+
+    monkeypatch.setattr(theme_manager.os, "replace", tracking_replace)
+
+    ThemeManager().set_theme("dark")
+
+    tmp_file = settings_file.with_name(settings_file.name + ".tmp")
+    assert replaced[-1] == (tmp_file, settings_file)
+    assert not tmp_file.exists()
+    assert json.loads(settings_file.read_text(encoding="utf-8"))["theme"] == "dark"
+    assert theme_manager._PENDING_WRITES == {}
+    assert ThemeManager().get_theme() == "dark"
+
+
+def test_pending_write_wins_over_file_and_flushes(monkeypatch, tmp_path):
+    settings_file = _use_app_root(monkeypatch, tmp_path)
+    ThemeManager().set_theme("light")
+
+    # Simulate a save still queued on the pool: pending but not yet on disk.
+    theme_manager._PENDING_WRITES[settings_file] = {
+        "theme": "dark",
+        "last_profile": "Queued",
+    }
+    manager = ThemeManager()
+    assert manager.get_theme() == "dark"
+    assert manager.get_last_profile() == "Queued"
+    assert json.loads(settings_file.read_text(encoding="utf-8"))["theme"] == "light"
+
+    theme_manager._flush_pending_writes()
+
+    assert theme_manager._PENDING_WRITES == {}
+    assert json.loads(settings_file.read_text(encoding="utf-8")) == {
+        "theme": "dark",
+        "last_profile": "Queued",
+    }
+
+
+def test_failed_write_is_logged_and_cleared(monkeypatch, tmp_path, caplog):
+    settings_file = _use_app_root(monkeypatch, tmp_path)
+    ThemeManager()
+
+    def failing_replace(src, dst):
+        raise OSError("read-only")
+
+    monkeypatch.setattr(theme_manager.os, "replace", failing_replace)
+    ThemeManager().set_theme("dark")
+
+    assert "Failed to save GUI settings" in caplog.text
+    assert theme_manager._PENDING_WRITES == {}
+    assert json.loads(settings_file.read_text(encoding="utf-8"))["theme"] == "light"